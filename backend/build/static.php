@@ -1,7 +1,7 @@
 <?php
 /**
  * Link Manager Widget for Static PHP Sites (API Key Version)
- * Version: 1.1.0
+ * Version: 1.2.0
  *
  * Uses API key instead of domain detection - same as WordPress plugin
  *
@@ -14,6 +14,7 @@
  * Features:
  * - Works with API key (like WordPress)
  * - 5-minute file-based caching
+ * - Reads pre-rendered static content first (no API load), falls back to API
  * - XSS protection
  * - No domain detection needed
  */
@@ -23,6 +24,7 @@
 // ========================================
 define('LM_API_KEY', 'YOUR_API_KEY_HERE'); // Replace with your actual API key from dashboard
 define('LM_API_URL', 'https://shark-app-9kv6u.ondigitalocean.app/api/wordpress/get-content');
+define('LM_STATIC_URL', 'https://shark-app-9kv6u.ondigitalocean.app/api/static-content/');
 // ========================================
 define('LM_CACHE_DIR', sys_get_temp_dir() . '/link-manager-cache');
 define('LM_CACHE_TTL', 300); // 5 minutes
@@ -95,18 +97,9 @@ function lm_set_cache($apiKey, $data) {
 }
 
 /**
- * Fetch links from API using API key
+ * HTTP GET returning response body or false on failure
  */
-function lm_fetch_links($apiKey) {
-    // Check cache first
-    $cached = lm_get_cache($apiKey);
-    if ($cached !== false) {
-        return $cached;
-    }
-
-    // Build API URL with query parameter
-    $url = LM_API_URL . '?api_key=' . urlencode($apiKey);
-
+function lm_http_get($url) {
     // Use cURL
     if (function_exists('curl_init')) {
         $ch = curl_init();
@@ -114,6 +107,7 @@ function lm_fetch_links($apiKey) {
         curl_setopt($ch, CURLOPT_RETURNTRANSFER, true);
         curl_setopt($ch, CURLOPT_TIMEOUT, LM_TIMEOUT);
         curl_setopt($ch, CURLOPT_FOLLOWLOCATION, true);
+        curl_setopt($ch, CURLOPT_ENCODING, ''); // Accept gzip/brotli (pre-compressed static content)
         curl_setopt($ch, CURLOPT_SSL_VERIFYPEER, false); // Disable SSL verification for compatibility
 
         $response = curl_exec($ch);
@@ -123,33 +117,76 @@ function lm_fetch_links($apiKey) {
         if ($http_code !== 200 || $response === false) {
             return false;
         }
-    } else {
-        // Fallback to file_get_contents
-        $context = stream_context_create([
-            'http' => [
-                'timeout' => LM_TIMEOUT,
-                'ignore_errors' => true
-            ],
-            'ssl' => [
-                'verify_peer' => false,
-                'verify_peer_name' => false
-            ]
-        ]);
-
-        $response = @file_get_contents($url, false, $context);
-
-        if ($response === false) {
-            return false;
-        }
+
+        return $response;
+    }
+
+    // Fallback to file_get_contents
+    $context = stream_context_create([
+        'http' => [
+            'timeout' => LM_TIMEOUT,
+            'ignore_errors' => true
+        ],
+        'ssl' => [
+            'verify_peer' => false,
+            'verify_peer_name' => false
+        ]
+    ]);
+
+    $response = @file_get_contents($url, false, $context);
+
+    if ($response === false) {
+        return false;
+    }
+
+    // ignore_errors returns error bodies too - only accept HTTP 200
+    if (isset($http_response_header[0]) && strpos($http_response_header[0], ' 200') === false) {
+        return false;
+    }
+
+    return $response;
+}
+
+/**
+ * Parse JSON response, returns false if it is not a valid content payload
+ */
+function lm_parse_response($response) {
+    if ($response === false) {
+        return false;
     }
 
-    // Parse JSON response
     $data = @json_decode($response, true);
 
     if ($data === null || !isset($data['links'])) {
         return false;
     }
 
+    return $data;
+}
+
+/**
+ * Fetch links using API key
+ * Tries the pre-rendered static file first, then falls back to the API
+ */
+function lm_fetch_links($apiKey) {
+    // Check cache first
+    $cached = lm_get_cache($apiKey);
+    if ($cached !== false) {
+        return $cached;
+    }
+
+    // Pre-rendered static content (file name is sha256 of the API key)
+    $data = lm_parse_response(lm_http_get(LM_STATIC_URL . hash('sha256', $apiKey) . '.json'));
+
+    if ($data === false) {
+        // Not rendered yet - use API with query parameter
+        $data = lm_parse_response(lm_http_get(LM_API_URL . '?api_key=' . urlencode($apiKey)));
+    }
+
+    if ($data === false) {
+        return false;
+    }
+
     // Cache the result
     lm_set_cache($apiKey, $data);
 
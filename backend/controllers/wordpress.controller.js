@@ -5,6 +5,7 @@
 
 const wordpressService = require('../services/wordpress.service');
 const siteService = require('../services/site.service');
+const staticContentService = require('../services/static-content.service');
 const { handleError, handleSmartError } = require('../utils/errorHandler');
 
 // Get content by API key (for WordPress plugin)
@@ -30,6 +31,9 @@ const getContent = async (req, res) => {
       endpoint_update: endpointUpdate
     };
 
+    // Fill in the pre-rendered static file on first poll (next polls skip Node entirely)
+    staticContentService.ensureRendered(apiKey);
+
     res.json(response);
   } catch (error) {
     return handleError(res, error, 'Failed to fetch content', 500);
@@ -150,6 +154,9 @@ const confirmEndpointUpdate = async (req, res) => {
     const result = await wordpressService.confirmEndpointUpdate(apiKey);
 
     if (result) {
+      // Drop endpoint_update from the pre-rendered static file
+      staticContentService.scheduleRender(apiKey);
+
       res.json({
         success: true,
         message: 'Endpoint update confirmed'
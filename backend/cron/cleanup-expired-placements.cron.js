@@ -6,6 +6,8 @@
 const cron = require('node-cron');
 const { pool, query } = require('../config/database');
 const logger = require('../config/logger');
+const cache = require('../services/cache.service');
+const staticContentService = require('../services/static-content.service');
 
 /**
  * Delete expired placements and clean up related data
@@ -22,7 +24,7 @@ async function cleanupExpiredPlacements() {
     // IMPORTANT: Exclude placements linked to active rentals (they are managed by rental lifecycle)
     const expiredResult = await client.query(`
       SELECT p.id, p.user_id, p.site_id, p.project_id, p.type, p.expires_at,
-             s.site_name, pr.name as project_name
+             s.site_name, s.api_key, pr.name as project_name
       FROM placements p
       JOIN sites s ON p.site_id = s.id
       JOIN projects pr ON p.project_id = pr.id
@@ -159,6 +161,13 @@ async function cleanupExpiredPlacements() {
 
     await client.query('COMMIT');
 
+    // Targeted cache invalidation - only affected sites
+    const apiKeys = [...new Set(expiredPlacements.map(p => p.api_key).filter(Boolean))];
+    for (const apiKey of apiKeys) {
+      await cache.del(`wp:content:${apiKey}`);
+      staticContentService.scheduleRender(apiKey);
+    }
+
     logger.info('Expired placements cleanup completed', {
       deleted: expiredPlacements.length,
       placementIds
@@ -3,6 +3,8 @@ const { pool } = require('../config/database');
 const logger = require('../config/logger');
 const notificationService = require('../services/notification.service');
 const wordpressRentalService = require('../services/wordpress-rental.service');
+const cache = require('../services/cache.service');
+const staticContentService = require('../services/static-content.service');
 
 /**
  * Process expired rentals:
@@ -199,6 +201,13 @@ async function processExpiredRentals() {
 
     await client.query('COMMIT');
 
+    // Rental placements were deleted - stop serving their links
+    const apiKeys = [...new Set(expiredRentals.rows.map(r => r.api_key).filter(Boolean))];
+    for (const apiKey of apiKeys) {
+      await cache.del(`wp:content:${apiKey}`);
+      staticContentService.scheduleRender(apiKey);
+    }
+
     logger.info(`[Cron] Successfully processed ${expiredRentals.rows.length} expired rentals`);
     return { processed: expiredRentals.rows.length };
   } catch (error) {
@@ -12,6 +12,7 @@ const { initHealthMonitor } = require('./health-monitor.cron');
 const { initExpiredPlacementsCleanupCron } = require('./cleanup-expired-placements.cron');
 const { initRentalExpirationCron } = require('./cleanup-expired-rentals.cron');
 const { initAutoRenewalRentalsCron } = require('./auto-renewal-rentals.cron');
+const { initStaticContentCron } = require('./render-static-content.cron');
 
 /**
  * Initialize all cron jobs
@@ -44,6 +45,9 @@ function initCronJobs() {
     // Initialize rental auto-renewal cron (daily at 08:00 UTC)
     initAutoRenewalRentalsCron();
 
+    // Initialize static content rebuild cron (daily at 01:30 UTC)
+    initStaticContentCron();
+
     logger.info('All cron jobs initialized successfully');
   } catch (error) {
     logger.error('Failed to initialize cron jobs', {
@@ -0,0 +1,39 @@
+/**
+ * Static content rebuild cron job
+ * Runs daily to re-render every site's pre-rendered content file
+ * Catches changes made outside the regular invalidation points (manual DB edits, render
+ * signals lost while Redis was down) and removes files of deleted sites
+ */
+
+const cron = require('node-cron');
+const logger = require('../config/logger');
+const staticContentService = require('../services/static-content.service');
+
+/**
+ * Initialize static content rebuild cron
+ * Runs daily at 01:30 UTC (after expired placements cleanup at 01:00)
+ */
+function initStaticContentCron() {
+  if (!staticContentService.isEnabled()) {
+    logger.info('[Cron] Static content rebuild disabled (STATIC_CONTENT_ENABLED=false)');
+    return;
+  }
+
+  cron.schedule(
+    '30 1 * * *',
+    async () => {
+      try {
+        await staticContentService.renderAllSites();
+      } catch (error) {
+        logger.error('[Cron] Static content rebuild failed:', error);
+      }
+    },
+    { timezone: 'UTC' }
+  );
+
+  logger.info('[Cron] Static content rebuild cron initialized (daily at 01:30 UTC)');
+}
+
+module.exports = {
+  initStaticContentCron
+};
@@ -7,6 +7,7 @@ const cron = require('node-cron');
 const { query, pool } = require('../config/database');
 const logger = require('../config/logger');
 const wordpressService = require('../services/wordpress.service');
+const staticContentService = require('../services/static-content.service');
 
 /**
  * Process scheduled placements that are due for publication
@@ -173,6 +174,7 @@ async function processScheduledPlacements() {
         );
 
         await placementClient.query('COMMIT');
+        staticContentService.scheduleRender(placement.api_key);
         return { success: true };
       } catch (error) {
         await placementClient.query('ROLLBACK');
@@ -280,6 +282,8 @@ async function processScheduledPlacements() {
           }
         }
 
+        // Failed/refunded placement must disappear from the pre-rendered static file
+        staticContentService.scheduleRender(placement.api_key);
         return { success: false };
       } finally {
         placementClient.release();
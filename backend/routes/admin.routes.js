@@ -773,16 +773,27 @@ router.post('/bulk-update-placement-status', async (req, res) => {
     const { query } = require('../config/database');
     const result = await query(
       `
-      UPDATE placements
+      UPDATE placements p
       SET status = $1::text,
-          published_at = CASE WHEN $1::text = 'placed' AND published_at IS NULL THEN NOW() ELSE published_at END,
+          published_at = CASE WHEN $1::text = 'placed' AND p.published_at IS NULL THEN NOW() ELSE p.published_at END,
           updated_at = NOW()
-      WHERE id = ANY($2::int[])
-      RETURNING id
+      FROM sites s
+      WHERE p.id = ANY($2::int[])
+        AND s.id = p.site_id
+      RETURNING p.id, s.api_key
       `,
       [newStatus, placementIds]
     );
 
+    // Status decides what plugins receive - invalidate affected sites only
+    const cache = require('../services/cache.service');
+    const staticContentService = require('../services/static-content.service');
+    const apiKeys = [...new Set(result.rows.map(r => r.api_key).filter(Boolean))];
+    for (const apiKey of apiKeys) {
+      await cache.del(`wp:content:${apiKey}`);
+      staticContentService.scheduleRender(apiKey);
+    }
+
     res.json({
       success: true,
       message: `Updated ${result.rowCount} placements to ${newStatus}`,
@@ -807,46 +818,86 @@ router.post('/bulk-update-placement-status', async (req, res) => {
 
 /**
  * @route POST /api/admin/broadcast-endpoint
- * @desc Broadcast new API endpoint to all WordPress sites
+ * @desc Broadcast new API endpoint to WordPress sites (all sites or a rollout cohort)
+ * @body newEndpoint - New API endpoint URL
+ * @body cohortType - 'all' (default) | 'percentage' | 'sites'
+ * @body percentage - 1-100, for cohortType 'percentage' (deterministic by site id)
+ * @body siteIds - Array of site IDs, for cohortType 'sites'
  * @access Admin only
  */
-router.post('/broadcast-endpoint', generalLimiter, async (req, res) => {
-  try {
-    // Support both newEndpoint (frontend) and new_endpoint (API consistency)
-    const newEndpoint = req.body.newEndpoint || req.body.new_endpoint;
+router.post(
+  '/broadcast-endpoint',
+  generalLimiter,
+  [
+    body('cohortType')
+      .optional()
+      .isIn(['all', 'percentage', 'sites'])
+      .withMessage('cohortType must be all, percentage or sites'),
+    body('percentage')
+      .if(body('cohortType').equals('percentage'))
+      .isInt({ min: 1, max: 100 })
+      .withMessage('percentage must be between 1 and 100'),
+    body('siteIds')
+      .if(body('cohortType').equals('sites'))
+      .isArray({ min: 1 })
+      .withMessage('siteIds must be a non-empty array'),
+    body('siteIds.*').optional().isInt({ min: 1 }).withMessage('siteIds must be integers')
+  ],
+  validateRequest,
+  async (req, res) => {
+    try {
+      // Support both newEndpoint (frontend) and new_endpoint (API consistency)
+      const newEndpoint = req.body.newEndpoint || req.body.new_endpoint;
 
-    if (!newEndpoint) {
-      return res.status(400).json({ error: 'newEndpoint is required' });
-    }
+      if (!newEndpoint) {
+        return res.status(400).json({ error: 'newEndpoint is required' });
+      }
 
-    // Validate URL format
-    try {
-      new URL(newEndpoint);
-    } catch {
-      return res.status(400).json({ error: 'Invalid endpoint URL format' });
-    }
+      // Validate URL format
+      try {
+        new URL(newEndpoint);
+      } catch {
+        return res.status(400).json({ error: 'Invalid endpoint URL format' });
+      }
 
-    const result = await siteService.broadcastEndpoint(newEndpoint);
+      const result = await siteService.broadcastEndpoint(newEndpoint, {
+        type: req.body.cohortType || 'all',
+        percentage: req.body.percentage,
+        siteIds: req.body.siteIds
+      });
 
-    res.json({
-      success: true,
-      updatedCount: result.updated,
-      message: result.message
-    });
-  } catch (error) {
-    logger.error('Broadcast endpoint error:', error);
-    res.status(500).json({ error: 'Failed to broadcast endpoint', details: error.message });
+      res.json({
+        success: true,
+        migrationId: result.migrationId,
+        updatedCount: result.updated,
+        message: result.message
+      });
+    } catch (error) {
+      logger.error('Broadcast endpoint error:', error);
+      // migrationId is set when some batches were applied - re-run the broadcast to finish it
+      res.status(500).json({
+        error: 'Failed to broadcast endpoint',
+        details: error.message,
+        migrationId: error.migrationId
+      });
+    }
   }
-});
+);
 
 /**
  * @route GET /api/admin/endpoint-migration-status
- * @desc Get current endpoint migration status
+ * @desc Get endpoint migration status (latest, or ?migrationId=)
  * @access Admin only
  */
 router.get('/endpoint-migration-status', generalLimiter, async (req, res) => {
   try {
-    const status = await siteService.getEndpointMigrationStatus();
+    const migrationId = req.query.migrationId ? parseInt(req.query.migrationId, 10) : null;
+
+    if (req.query.migrationId && isNaN(migrationId)) {
+      return res.status(400).json({ error: 'Invalid migrationId' });
+    }
+
+    const status = await siteService.getEndpointMigrationStatus(migrationId);
     res.json({
       success: true,
       data: status
@@ -14,6 +14,7 @@ const queueService = require('../config/queue');
 const Sentry = require('@sentry/node');
 const { runManualBackup } = require('../cron/database-backup.cron');
 const emailService = require('../services/email.service');
+const trafficCapture = require('../utils/trafficCapture');
 
 // Anomaly thresholds
 const THRESHOLDS = {
@@ -44,6 +45,12 @@ function trackRequest(req, res, next) {
   const endpoint = `${req.method} ${req.path}`;
   requestMetrics.byEndpoint[endpoint] = (requestMetrics.byEndpoint[endpoint] || 0) + 1;
 
+  // Opt-in anonymized capture for load replay (TRAFFIC_CAPTURE_FILE)
+  const capture = trafficCapture.isEnabled();
+  if (capture) {
+    trafficCapture.attachShapeRecorder(res);
+  }
+
   res.on('finish', () => {
     const duration = Date.now() - start;
     // Keep last 100 response times for averaging
@@ -56,6 +63,12 @@ function trackRequest(req, res, next) {
       requestMetrics.errors.count++;
       requestMetrics.errors.last = new Date().toISOString();
     }
+
+    if (capture) {
+      trafficCapture.writeRecord(
+        trafficCapture.buildRecord(req, res, duration, res.locals.captureShape || null)
+      );
+    }
   });
 
   next();
@@ -14,6 +14,7 @@ const siteRoutes = require('./site.routes');
 const placementRoutes = require('./placement.routes');
 const wordpressRoutes = require('./wordpress.routes');
 const staticRoutes = require('./static.routes');
+const staticContentRoutes = require('./static-content.routes');
 const billingRoutes = require('./billing.routes');
 const adminRoutes = require('./admin.routes');
 const notificationRoutes = require('./notification.routes');
@@ -66,6 +67,7 @@ router.use('/sites', siteRoutes);
 router.use('/placements', placementRoutes);
 router.use('/wordpress', wordpressRoutes);
 router.use('/static', staticRoutes); // Public API for static PHP widgets
+router.use('/static-content', staticContentRoutes); // Pre-rendered content files (no DB)
 router.use('/billing', billingRoutes);
 router.use('/admin', adminRoutes);
 router.use('/notifications', notificationRoutes);
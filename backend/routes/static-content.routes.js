@@ -0,0 +1,69 @@
+/**
+ * Static content routes
+ * Serves pre-rendered, precompressed site payloads (see static-content.service.js)
+ * No DB access and no rate limit - each request is a single file read
+ *
+ * GET /api/static-content/<sha256(api_key)>.json
+ * Files are served only through this route (never straight from STATIC_CONTENT_DIR):
+ * files that may have missed a render signal are answered with 404 so clients use the API
+ */
+
+const express = require('express');
+const path = require('path');
+const router = express.Router();
+const staticContentService = require('../services/static-content.service');
+
+// Browsers/plugins may reuse a response briefly; content changes are picked up within a minute
+const CACHE_CONTROL = 'public, max-age=60, stale-while-revalidate=300';
+
+// Precompressed variants in order of preference
+const ENCODINGS = [
+  { name: 'br', ext: '.br' },
+  { name: 'gzip', ext: '.gz' }
+];
+
+router.get('/:file([a-f0-9]{64}\\.json)', async (req, res, next) => {
+  // Written before the last render sync (re)connect - force the API fallback,
+  // which re-renders this instance's copy
+  if (!(await staticContentService.isCurrent(req.params.file))) {
+    return res.status(404).json({ error: 'Static content not found' });
+  }
+
+  const encoding = ENCODINGS.find(enc => req.acceptsEncodings(enc.name) === enc.name);
+  const fileName = encoding ? req.params.file + encoding.ext : req.params.file;
+
+  const headers = {
+    'Content-Type': 'application/json; charset=utf-8',
+    'Cache-Control': CACHE_CONTROL,
+    Vary: 'Accept-Encoding'
+  };
+
+  if (encoding) {
+    // compression() middleware skips responses that already carry Content-Encoding
+    headers['Content-Encoding'] = encoding.name;
+  }
+
+  res.sendFile(
+    fileName,
+    {
+      root: path.resolve(staticContentService.getContentDir()),
+      cacheControl: false,
+      headers
+    },
+    err => {
+      if (!err) return;
+
+      // Not rendered yet - clients fall back to /api/wordpress/get-content
+      if (err.code === 'ENOENT' || err.status === 404) {
+        if (!res.headersSent) {
+          res.status(404).json({ error: 'Static content not found' });
+        }
+        return;
+      }
+
+      next(err);
+    }
+  );
+});
+
+module.exports = router;
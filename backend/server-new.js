@@ -40,6 +40,9 @@ try {
 // Cron jobs
 const { initCronJobs } = require('./cron');
 
+// Static content render sync between instances
+const staticContentService = require('./services/static-content.service');
+
 const PORT = process.env.PORT || 3000;
 
 // Initialize application
@@ -86,6 +89,9 @@ async function startServer() {
       // Continue without cron jobs - they can be run manually if needed
     }
 
+    // Re-render static content files when other instances announce a render
+    staticContentService.initRenderSync();
+
     // Log Sentry status
     if (process.env.SENTRY_DSN) {
       logger.info('Sentry error monitoring initialized');
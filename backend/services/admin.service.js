@@ -672,11 +672,13 @@ const refundPlacement = async (placementId, reason, adminId, deleteWordPressPost
 
     // 8. Clear cache
     const cache = require('./cache.service');
+    const staticContentService = require('./static-content.service');
     await cache.delPattern(`placements:user:${placement.user_id}:*`);
     await cache.delPattern(`projects:user:${placement.user_id}:*`);
     // Targeted cache invalidation - only this site
     if (placement.api_key) {
       await cache.del(`wp:content:${placement.api_key}`);
+      staticContentService.scheduleRender(placement.api_key);
     }
 
     logger.info('Admin manual refund completed', {
@@ -897,11 +899,13 @@ const approvePlacement = async (placementId, adminId) => {
 
     // Clear cache after approval
     const cache = require('./cache.service');
+    const staticContentService = require('./static-content.service');
     await cache.delPattern(`placements:user:${placement.user_id}:*`);
     await cache.delPattern(`projects:user:${placement.user_id}:*`);
     // Targeted cache invalidation - only this site
     if (placement.api_key) {
       await cache.del(`wp:content:${placement.api_key}`);
+      staticContentService.scheduleRender(placement.api_key);
     }
 
     logger.info('Placement approved by admin', {
@@ -1029,11 +1033,13 @@ const rejectPlacement = async (placementId, adminId, reason = 'Rejected by admin
 
     // Clear cache
     const cache = require('./cache.service');
+    const staticContentService = require('./static-content.service');
     await cache.delPattern(`placements:user:${placement.user_id}:*`);
     await cache.delPattern(`projects:user:${placement.user_id}:*`);
     // Targeted cache invalidation - only this site
     if (placement.api_key) {
       await cache.del(`wp:content:${placement.api_key}`);
+      staticContentService.scheduleRender(placement.api_key);
     }
 
     logger.info('Placement rejected by admin', {
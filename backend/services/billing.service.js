@@ -6,6 +6,7 @@
 const { pool, query } = require('../config/database');
 const logger = require('../config/logger');
 const cache = require('./cache.service');
+const staticContentService = require('./static-content.service');
 const wordpressService = require('./wordpress.service');
 const wordpressRentalService = require('./wordpress-rental.service');
 const { checkAnomalousTransaction } = require('./security-alerts.service');
@@ -1049,6 +1050,8 @@ const purchasePlacement = async ({
         })
       );
     }
+    // Both site types poll by API key - regenerate the pre-rendered static file
+    staticContentService.scheduleRender(site.api_key);
 
     // OPTIMIZATION: Async WordPress publication (after commit)
     // Don't block response - publish in background
@@ -1529,6 +1532,7 @@ const renewPlacement = async (placementId, userId, isAutoRenewal = false) => {
     // Targeted cache invalidation - only this site
     if (placement.api_key) {
       await cache.del(`wp:content:${placement.api_key}`);
+      staticContentService.scheduleRender(placement.api_key);
     }
 
     logger.info('Placement renewed successfully', {
@@ -2370,6 +2374,7 @@ const deleteAndRefundPlacement = async (placementId, userId, userRole = 'user')
     // Targeted cache invalidation - only this site
     if (placement.api_key) {
       await cache.del(`wp:content:${placement.api_key}`);
+      staticContentService.scheduleRender(placement.api_key);
     }
 
     logger.info('Placement deleted atomically with refund by admin', {
@@ -2567,6 +2572,7 @@ const batchPurchasePlacements = async (userId, purchases) => {
     );
     for (const site of sitesResult.rows) {
       await cache.del(`wp:content:${site.api_key}`);
+      staticContentService.scheduleRender(site.api_key);
     }
   }
 
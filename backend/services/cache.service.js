@@ -12,6 +12,9 @@ const logger = require('../config/logger');
 let redis = null;
 let cacheAvailable = false;
 
+// Dedicated connection for pub/sub (a subscribed connection can't run other commands)
+let subscriber = null;
+
 // Initialize Redis connection
 function initRedis() {
   try {
@@ -208,6 +211,58 @@ async function getStats() {
   }
 }
 
+/**
+ * Publish message to a channel (all app instances subscribed to it receive it)
+ * @param {string} channel - Channel name
+ * @param {string} message - Message payload
+ * @returns {Promise<boolean>} - Success status
+ */
+async function publish(channel, message) {
+  if (!cacheAvailable || !redis) return false;
+
+  try {
+    await redis.publish(channel, message);
+    return true;
+  } catch (error) {
+    logger.warn('Cache publish error:', error.message);
+    return false;
+  }
+}
+
+/**
+ * Subscribe to a channel on the dedicated subscriber connection
+ * Resubscribes automatically after reconnects; messages published while disconnected are lost
+ * @param {string} channel - Channel name
+ * @param {Function} onMessage - Called with each message payload
+ * @param {Function} [onReady] - Called on every (re)connect of the subscriber connection
+ * @returns {boolean} - false if Redis is not configured
+ */
+function subscribe(channel, onMessage, onReady) {
+  if (!redis) return false;
+
+  if (!subscriber) {
+    subscriber = redis.duplicate();
+
+    subscriber.on('error', err => {
+      logger.warn('Redis subscriber error:', err.message);
+    });
+  }
+
+  subscriber.on('message', (messageChannel, message) => {
+    if (messageChannel === channel) onMessage(message);
+  });
+
+  if (onReady) {
+    subscriber.on('ready', onReady);
+  }
+
+  subscriber.subscribe(channel).catch(err => {
+    logger.warn('Redis subscribe error:', err.message);
+  });
+
+  return true;
+}
+
 // Initialize on module load
 initRedis();
 
@@ -218,5 +273,7 @@ module.exports = {
   delPattern,
   clearRentalCache,
   getStats,
+  publish,
+  subscribe,
   isAvailable: () => cacheAvailable
 };
@@ -6,6 +6,7 @@
 const { pool, query } = require('../config/database');
 const logger = require('../config/logger');
 const cache = require('./cache.service');
+const staticContentService = require('./static-content.service');
 const wordpressService = require('./wordpress.service');
 
 // Get user placements with statistics (with caching)
@@ -570,6 +571,7 @@ const createPlacement = async data => {
     // Targeted cache invalidation - only this site, not all sites
     if (site.api_key) {
       await cache.del(`wp:content:${site.api_key}`);
+      staticContentService.scheduleRender(site.api_key);
     }
     logger.debug('Cache invalidated after placement creation', {
       userId,
@@ -175,11 +175,13 @@ const deleteProject = async (projectId, userId) => {
     // Clear cache after project deletion
     if (result.rows.length > 0) {
       const cache = require('./cache.service');
+      const staticContentService = require('./static-content.service');
       await cache.delPattern(`projects:user:${userId}:*`);
       await cache.delPattern(`placements:user:${userId}:*`);
       // Targeted cache invalidation - only affected sites
       for (const site of affectedSites.rows) {
         await cache.del(`wp:content:${site.api_key}`);
+        staticContentService.scheduleRender(site.api_key);
       }
     }
 
@@ -281,6 +283,7 @@ const updateProjectLink = async (projectId, linkId, userId, linkData) => {
 
     // Clear cache after link update
     const cache = require('./cache.service');
+    const staticContentService = require('./static-content.service');
     await cache.delPattern(`projects:user:${userId}:*`);
     // Targeted cache invalidation - only sites using this link
     const affectedSites = await query(
@@ -292,6 +295,7 @@ const updateProjectLink = async (projectId, linkId, userId, linkData) => {
     );
     for (const site of affectedSites.rows) {
       await cache.del(`wp:content:${site.api_key}`);
+      staticContentService.scheduleRender(site.api_key);
     }
 
     return result.rows[0];
@@ -436,10 +440,12 @@ const deleteProjectLink = async (projectId, linkId, userId) => {
     // Clear cache after link deletion
     if (result.rows.length > 0) {
       const cache = require('./cache.service');
+      const staticContentService = require('./static-content.service');
       await cache.delPattern(`projects:user:${userId}:*`);
       // Targeted cache invalidation - only affected sites
       for (const site of affectedSites.rows) {
         await cache.del(`wp:content:${site.api_key}`);
+        staticContentService.scheduleRender(site.api_key);
       }
     }
 
@@ -580,6 +586,7 @@ const updateProjectArticle = async (projectId, articleId, userId, articleData) =
     // Clear cache after article update
     if (result.rows.length > 0) {
       const cache = require('./cache.service');
+      const staticContentService = require('./static-content.service');
       await cache.delPattern(`projects:user:${userId}:*`);
       // Targeted cache invalidation - only sites using this article
       const affectedSites = await query(
@@ -591,6 +598,7 @@ const updateProjectArticle = async (projectId, articleId, userId, articleData) =
       );
       for (const site of affectedSites.rows) {
         await cache.del(`wp:content:${site.api_key}`);
+        staticContentService.scheduleRender(site.api_key);
       }
     }
 
@@ -626,10 +634,12 @@ const deleteProjectArticle = async (projectId, articleId, userId) => {
     // Clear cache after article deletion
     if (result.rows.length > 0) {
       const cache = require('./cache.service');
+      const staticContentService = require('./static-content.service');
       await cache.delPattern(`projects:user:${userId}:*`);
       // Targeted cache invalidation - only affected sites
       for (const site of affectedSites.rows) {
         await cache.del(`wp:content:${site.api_key}`);
+        staticContentService.scheduleRender(site.api_key);
       }
     }
 
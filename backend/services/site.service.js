@@ -420,11 +420,13 @@ const updateSite = async (siteId, userId, data, userRole = null) => {
     // Clear cache after site update so UI shows changes immediately
     if (result.rows.length > 0) {
       const cache = require('./cache.service');
+      const staticContentService = require('./static-content.service');
       await cache.delPattern(`placements:user:${userId}:*`);
       // Targeted cache invalidation - only this site
       const updatedSite = result.rows[0];
       if (updatedSite.api_key) {
         await cache.del(`wp:content:${updatedSite.api_key}`);
+        staticContentService.scheduleRender(updatedSite.api_key);
       }
     }
 
@@ -610,6 +612,20 @@ const deleteSite = async (siteId, userId) => {
       [siteId]
     );
 
+    // 4.5. Release site from its endpoint migration counters
+    // CASCADE removes site_endpoint_updates but not the incrementally maintained counts
+    await client.query(
+      `
+      UPDATE endpoint_migrations em
+      SET total_sites = GREATEST(0, em.total_sites - 1),
+          confirmed_sites = GREATEST(0, em.confirmed_sites - (seu.status = 'confirmed')::int)
+      FROM site_endpoint_updates seu
+      WHERE seu.site_id = $1
+        AND em.id = seu.migration_id
+    `,
+      [siteId]
+    );
+
     // 5. Delete site (CASCADE will delete all placements and placement_content)
     await client.query('DELETE FROM sites WHERE id = $1 AND user_id = $2', [siteId, userId]);
 
@@ -644,11 +660,13 @@ const deleteSite = async (siteId, userId) => {
 
     // 8. Clear cache
     const cache = require('./cache.service');
+    const staticContentService = require('./static-content.service');
     await cache.delPattern(`placements:user:${userId}:*`);
     await cache.delPattern(`projects:user:${userId}:*`);
     // Targeted cache invalidation - only this site (before deletion, site variable still has api_key)
     if (site.api_key) {
       await cache.del(`wp:content:${site.api_key}`);
+      staticContentService.scheduleRender(site.api_key);
     }
 
     logger.info('Site deleted with automatic refunds', {
@@ -1409,12 +1427,89 @@ const calculateSiteRevenue = async (siteId, userId) => {
   }
 };
 
+// Endpoint broadcast configuration
+const ENDPOINT_BROADCAST_CONFIG = {
+  batchSize: 5000, // Sites upserted per statement (keyset batches for very large fleets)
+  cohortTypes: ['all', 'percentage', 'sites']
+};
+
+/**
+ * Build cohort filter for endpoint broadcast
+ * Percentage cohorts are deterministic by site id, so widening 10% -> 50% keeps the first cohort
+ * @returns {{ sql: string, params: Array }} - WHERE fragment for `sites s`, params start at $4
+ */
+const buildEndpointCohortFilter = cohort => {
+  if (cohort.type === 'percentage') {
+    return { sql: 's.id % 100 < $4', params: [cohort.percentage] };
+  }
+  if (cohort.type === 'sites') {
+    return { sql: 's.id = ANY($4::int[])', params: [cohort.siteIds] };
+  }
+  return { sql: 'TRUE', params: [] };
+};
+
+/**
+ * Validate and normalize broadcast cohort
+ * @param {Object} [cohort] - { type: 'all' } | { type: 'percentage', percentage } | { type: 'sites', siteIds }
+ */
+const normalizeEndpointCohort = (cohort = {}) => {
+  const type = cohort.type || 'all';
+
+  if (!ENDPOINT_BROADCAST_CONFIG.cohortTypes.includes(type)) {
+    throw new Error(`Invalid cohort type: ${type}`);
+  }
+
+  if (type === 'percentage') {
+    const percentage = parseInt(cohort.percentage, 10);
+    if (!Number.isInteger(percentage) || percentage < 1 || percentage > 100) {
+      throw new Error('Cohort percentage must be between 1 and 100');
+    }
+    return { type, percentage };
+  }
+
+  if (type === 'sites') {
+    const siteIds = [
+      ...new Set((cohort.siteIds || []).map(id => parseInt(id, 10)).filter(Number.isInteger))
+    ];
+    if (siteIds.length === 0) {
+      throw new Error('Cohort site list is empty');
+    }
+    return { type, siteIds };
+  }
+
+  return { type };
+};
+
 /**
- * Broadcast new API endpoint to all sites
- * Creates pending endpoint update records for all sites
+ * Delete a migration that queued no sites
+ * An empty migration would become "latest" and hide the real rollout in the admin status
+ */
+const removeEmptyMigration = migrationId =>
+  query('DELETE FROM endpoint_migrations WHERE id = $1 AND total_sites = 0', [migrationId]);
+
+/**
+ * Broadcast new API endpoint to a cohort of sites
+ * Creates one endpoint_migrations row and upserts pending updates set-based,
+ * one statement per batch of sites (no per-site round trips)
+ * Progress counters are maintained incrementally:
+ * - total_sites of this migration += sites upserted
+ * - total_sites of superseded migrations -= their pending sites moved here
+ * Sites that already confirmed the same endpoint are left untouched
  * Plugins will receive the update on next API call
+ *
+ * Batches commit independently. If one fails, the batches already applied stay (with
+ * consistent counters) and the error carries migrationId/lastSiteId. Re-running the same
+ * broadcast resumes safely: pending sites move to the new migration, confirmed ones are kept
+ * A broadcast that queues no site leaves no migration behind
+ * @param {string} newEndpoint - New API endpoint URL
+ * @param {Object} [cohort] - Rollout cohort (default: all sites)
  */
-const broadcastEndpoint = async newEndpoint => {
+const broadcastEndpoint = async (newEndpoint, cohort) => {
+  // Outside try - the error handler reports/cleans up a partially applied broadcast
+  let migrationId = null;
+  let updated = 0;
+  let lastSiteId = 0;
+
   try {
     // Validate endpoint URL
     try {
@@ -1423,70 +1518,178 @@ const broadcastEndpoint = async newEndpoint => {
       throw new Error('Invalid endpoint URL');
     }
 
-    // Get all sites
-    const sites = await query('SELECT id FROM sites');
+    const normalizedCohort = normalizeEndpointCohort(cohort);
+    const cohortFilter = buildEndpointCohortFilter(normalizedCohort);
 
-    if (sites.rows.length === 0) {
-      return { updated: 0, message: 'No sites found' };
-    }
-
-    // Create/update endpoint update records for all sites
-    let updated = 0;
-    for (const site of sites.rows) {
-      await query(
-        `INSERT INTO site_endpoint_updates (site_id, new_endpoint, status)
-         VALUES ($1, $2, 'pending')
-         ON CONFLICT (site_id) DO UPDATE SET
-           new_endpoint = $2,
-           status = 'pending',
-           created_at = NOW(),
-           confirmed_at = NULL`,
-        [site.id, newEndpoint]
+    const migrationResult = await query(
+      `INSERT INTO endpoint_migrations (new_endpoint, cohort_type, cohort_percentage)
+       VALUES ($1, $2, $3)
+       RETURNING id`,
+      [newEndpoint, normalizedCohort.type, normalizedCohort.percentage || null]
+    );
+    migrationId = migrationResult.rows[0].id;
+
+    const staticContentService = require('./static-content.service');
+
+    // Keyset batches over sites.id - each batch is one atomic statement
+    let batchCount = 0;
+
+    for (;;) {
+      const batchResult = await query(
+        `WITH batch AS (
+           SELECT s.id, s.api_key
+           FROM sites s
+           WHERE s.id > $3 AND ${cohortFilter.sql}
+           ORDER BY s.id
+           LIMIT ${ENDPOINT_BROADCAST_CONFIG.batchSize}
+         ),
+         locked AS (
+           -- Serialize with confirmEndpointUpdate: a confirm committed before the lock is seen
+           -- here (locked rows are re-read at their latest version), later ones wait for COMMIT
+           SELECT seu.site_id, seu.migration_id, seu.status
+           FROM site_endpoint_updates seu
+           JOIN batch b ON b.id = seu.site_id
+           ORDER BY seu.site_id
+           FOR UPDATE OF seu
+         ),
+         superseded AS (
+           SELECT l.migration_id, COUNT(*) AS sites_count
+           FROM locked l
+           WHERE l.status = 'pending' AND l.migration_id IS NOT NULL
+           GROUP BY l.migration_id
+         ),
+         superseded_update AS (
+           UPDATE endpoint_migrations em
+           SET total_sites = GREATEST(0, em.total_sites - sup.sites_count)
+           FROM superseded sup
+           WHERE em.id = sup.migration_id
+         ),
+         upserted AS (
+           INSERT INTO site_endpoint_updates (site_id, new_endpoint, status, migration_id)
+           SELECT b.id, $1, 'pending', $2 FROM batch b
+           -- Evaluated once before the first row: every existing row is locked before upserting
+           WHERE (SELECT COUNT(*) FROM locked) >= 0
+           ON CONFLICT (site_id) DO UPDATE SET
+             new_endpoint = EXCLUDED.new_endpoint,
+             status = 'pending',
+             migration_id = EXCLUDED.migration_id,
+             created_at = NOW(),
+             confirmed_at = NULL
+           WHERE NOT (
+             site_endpoint_updates.status = 'confirmed'
+             AND site_endpoint_updates.new_endpoint = EXCLUDED.new_endpoint
+           )
+           RETURNING site_id
+         ),
+         counted AS (
+           UPDATE endpoint_migrations
+           SET total_sites = total_sites + (SELECT COUNT(*) FROM upserted)
+           WHERE id = $2
+         )
+         SELECT
+           (SELECT MAX(id) FROM batch) AS last_site_id,
+           (SELECT COUNT(*) FROM batch)::int AS batch_size,
+           (SELECT COUNT(*) FROM upserted)::int AS upserted_count,
+           COALESCE(
+             (SELECT array_agg(b.api_key) FROM batch b
+              JOIN upserted u ON u.site_id = b.id
+              WHERE b.api_key IS NOT NULL),
+             '{}'
+           ) AS api_keys`,
+        [newEndpoint, migrationId, lastSiteId, ...cohortFilter.params]
       );
-      updated++;
+
+      const batch = batchResult.rows[0];
+      if (!batch || batch.batch_size === 0) break;
+
+      updated += batch.upserted_count;
+      lastSiteId = batch.last_site_id;
+      batchCount++;
+
+      // Pre-rendered static files carry endpoint_update - regenerate for this batch
+      batch.api_keys.forEach(apiKey => staticContentService.scheduleRender(apiKey));
+
+      if (batch.batch_size < ENDPOINT_BROADCAST_CONFIG.batchSize) break;
     }
 
     logger.info('Broadcast endpoint update', {
       newEndpoint,
-      sitesUpdated: updated
+      migrationId,
+      cohort: normalizedCohort.type,
+      sitesUpdated: updated,
+      batches: batchCount
     });
 
+    if (updated === 0) {
+      await removeEmptyMigration(migrationId);
+      return {
+        updated: 0,
+        migrationId: null,
+        message: batchCount === 0 ? 'No sites found' : 'All sites already confirmed this endpoint'
+      };
+    }
+
     return {
       updated,
+      migrationId,
       message: `Endpoint update queued for ${updated} sites`
     };
   } catch (error) {
-    logger.error('Broadcast endpoint error:', error);
+    if (migrationId && updated === 0) {
+      await removeEmptyMigration(migrationId).catch(() => {});
+    } else if (migrationId) {
+      // Applied batches stay - re-run the same broadcast to cover the remaining sites
+      error.migrationId = migrationId;
+      error.lastSiteId = lastSiteId;
+    }
+    logger.error('Broadcast endpoint error:', {
+      error: error.message,
+      migrationId,
+      lastSiteId,
+      sitesUpdated: updated
+    });
     throw error;
   }
 };
 
 /**
  * Get endpoint migration status (how many sites confirmed)
+ * Reads incrementally maintained counters - no COUNT over site_endpoint_updates
+ * @param {number} [migrationId] - Specific migration (default: latest)
  */
-const getEndpointMigrationStatus = async () => {
+const getEndpointMigrationStatus = async migrationId => {
   try {
-    const result = await query(
-      `SELECT
-         COUNT(*) FILTER (WHERE status = 'pending') as pending,
-         COUNT(*) FILTER (WHERE status = 'confirmed') as confirmed,
-         COUNT(*) as total,
-         new_endpoint
-       FROM site_endpoint_updates
-       GROUP BY new_endpoint
-       ORDER BY MAX(created_at) DESC
-       LIMIT 1`
-    );
+    const result = migrationId
+      ? await query(
+          `SELECT id, new_endpoint, cohort_type, cohort_percentage, total_sites, confirmed_sites, created_at
+           FROM endpoint_migrations
+           WHERE id = $1`,
+          [migrationId]
+        )
+      : await query(
+          `SELECT id, new_endpoint, cohort_type, cohort_percentage, total_sites, confirmed_sites, created_at
+           FROM endpoint_migrations
+           ORDER BY created_at DESC, id DESC
+           LIMIT 1`
+        );
 
     if (result.rows.length === 0) {
       return { pending: 0, confirmed: 0, total: 0, new_endpoint: null };
     }
 
+    const migration = result.rows[0];
+    const total = parseInt(migration.total_sites);
+    const confirmed = parseInt(migration.confirmed_sites);
+
     return {
-      pending: parseInt(result.rows[0].pending),
-      confirmed: parseInt(result.rows[0].confirmed),
-      total: parseInt(result.rows[0].total),
-      new_endpoint: result.rows[0].new_endpoint
+      migration_id: migration.id,
+      pending: Math.max(0, total - confirmed),
+      confirmed,
+      total,
+      new_endpoint: migration.new_endpoint,
+      cohort_type: migration.cohort_type,
+      cohort_percentage: migration.cohort_percentage,
+      created_at: migration.created_at
     };
   } catch (error) {
     logger.error('Get endpoint migration status error:', error);
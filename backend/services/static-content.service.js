@@ -0,0 +1,351 @@
+/**
+ * Static content service
+ * Pre-renders each site's link/article payload to precompressed static files
+ * so polling plugins and static PHP widgets never reach the database
+ *
+ * Files are served only through static-content.routes.js (the route checks isCurrent())
+ * Each instance keeps its own STATIC_CONTENT_DIR - renders are announced over Redis pub/sub
+ * so every instance re-renders its copy
+ * Layout (one set of files per site, keyed by sha256 of the API key):
+ *   <STATIC_CONTENT_DIR>/<sha256(api_key)>.json      - identity
+ *   <STATIC_CONTENT_DIR>/<sha256(api_key)>.json.gz   - gzip
+ *   <STATIC_CONTENT_DIR>/<sha256(api_key)>.json.br   - brotli
+ */
+
+const fs = require('fs').promises;
+const path = require('path');
+const crypto = require('crypto');
+const zlib = require('zlib');
+const { promisify } = require('util');
+const { query } = require('../config/database');
+const logger = require('../config/logger');
+const wordpressService = require('./wordpress.service');
+const cache = require('./cache.service');
+
+const gzip = promisify(zlib.gzip);
+const brotliCompress = promisify(zlib.brotliCompress);
+
+// Render configuration
+const RENDER_CONFIG = {
+  debounceMs: 2000, // Coalesce bursts of placement changes into one render per site
+  concurrency: 5 // Parallel renders (4 DB queries each)
+};
+
+// Pending API keys waiting for the next debounced render pass
+const pendingKeys = new Set();
+let flushTimer = null;
+
+// Renders in progress per API key: { promise, rerun } (never two writers for the same files)
+const inFlight = new Map();
+
+// Cross-instance render signal: { instanceId, apiKey }
+const RENDER_CHANNEL = 'static-content:render';
+const instanceId = crypto.randomUUID();
+
+// Files written before this moment may have missed a render signal (process start, Redis reconnect)
+let validSince = Date.now();
+
+/**
+ * Whether static rendering is enabled (STATIC_CONTENT_ENABLED=false disables it)
+ */
+const isEnabled = () => process.env.STATIC_CONTENT_ENABLED !== 'false';
+
+/**
+ * Directory holding the rendered files
+ */
+const getContentDir = () =>
+  process.env.STATIC_CONTENT_DIR || path.join(__dirname, '..', '..', 'static-content');
+
+/**
+ * Public file name for an API key
+ * SECURITY: Hash the key so file names never expose API keys (e.g. in directory listings)
+ */
+const getFileName = apiKey =>
+  crypto.createHash('sha256').update(String(apiKey)).digest('hex') + '.json';
+
+/**
+ * Write file atomically (temp file + rename) so readers never see partial content
+ */
+async function writeAtomic(filePath, data) {
+  // Unique per write - concurrent renders must never share (and truncate) a temp file
+  const tempPath = `${filePath}.${crypto.randomUUID()}.tmp`;
+  await fs.writeFile(tempPath, data);
+  await fs.rename(tempPath, filePath);
+}
+
+/**
+ * Remove rendered files for an API key (site deleted or key rotated)
+ */
+async function removeSite(apiKey) {
+  const basePath = path.join(getContentDir(), getFileName(apiKey));
+
+  await Promise.all(
+    [basePath, `${basePath}.gz`, `${basePath}.br`].map(file =>
+      fs.unlink(file).catch(err => {
+        if (err.code !== 'ENOENT') throw err;
+      })
+    )
+  );
+}
+
+/**
+ * Render the payload for one site to identity, gzip and brotli files
+ * Payload matches GET /api/wordpress/get-content exactly
+ * If the site is already rendering, one more render runs after it finishes
+ * (the running one may have read data from before the latest change)
+ * @param {string} apiKey - Site API key
+ * @returns {Promise<boolean>} - true if rendered, false if site no longer exists
+ */
+function renderSite(apiKey) {
+  const current = inFlight.get(apiKey);
+
+  if (current) {
+    if (!current.rerun) {
+      current.rerun = current.promise.catch(() => {}).then(() => renderSite(apiKey));
+    }
+    return current.rerun;
+  }
+
+  const entry = { promise: null, rerun: null };
+  entry.promise = renderSiteFiles(apiKey).finally(() => inFlight.delete(apiKey));
+  inFlight.set(apiKey, entry);
+
+  return entry.promise;
+}
+
+/**
+ * Load content and write the files (callers go through renderSite)
+ */
+async function renderSiteFiles(apiKey) {
+  const siteResult = await query('SELECT id FROM sites WHERE api_key = $1', [apiKey]);
+
+  if (siteResult.rows.length === 0) {
+    await removeSite(apiKey);
+    return false;
+  }
+
+  const content = await wordpressService.loadContentByApiKey(apiKey);
+  const endpointUpdate = await wordpressService.getEndpointUpdate(apiKey);
+
+  const body = Buffer.from(
+    JSON.stringify({
+      ...content,
+      endpoint_update: endpointUpdate
+    })
+  );
+
+  const [gzipped, brotli] = await Promise.all([
+    gzip(body, { level: zlib.constants.Z_BEST_COMPRESSION }),
+    brotliCompress(body, {
+      params: {
+        [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+        [zlib.constants.BROTLI_PARAM_SIZE_HINT]: body.length
+      }
+    })
+  ]);
+
+  const contentDir = getContentDir();
+  await fs.mkdir(contentDir, { recursive: true });
+
+  const basePath = path.join(contentDir, getFileName(apiKey));
+
+  // Compressed variants first, identity last - identity file existence marks a complete render
+  await writeAtomic(`${basePath}.gz`, gzipped);
+  await writeAtomic(`${basePath}.br`, brotli);
+  await writeAtomic(basePath, body);
+
+  logger.debug('Static content rendered', {
+    siteId: siteResult.rows[0].id,
+    linksCount: content.links.length,
+    articlesCount: content.articles.length,
+    bytes: body.length
+  });
+
+  return true;
+}
+
+/**
+ * Render a list of API keys with bounded concurrency
+ * @returns {Promise<{rendered: number, removed: number, failed: number}>}
+ */
+async function renderMany(apiKeys) {
+  const stats = { rendered: 0, removed: 0, failed: 0 };
+
+  for (let i = 0; i < apiKeys.length; i += RENDER_CONFIG.concurrency) {
+    const batch = apiKeys.slice(i, i + RENDER_CONFIG.concurrency);
+    const results = await Promise.allSettled(batch.map(apiKey => renderSite(apiKey)));
+
+    results.forEach(result => {
+      if (result.status === 'rejected') {
+        stats.failed++;
+        logger.error('Static content render failed', { error: result.reason?.message });
+      } else if (result.value) {
+        stats.rendered++;
+      } else {
+        stats.removed++;
+      }
+    });
+  }
+
+  return stats;
+}
+
+/**
+ * Drain pending API keys (called by the debounce timer)
+ */
+async function flushPending() {
+  flushTimer = null;
+
+  const apiKeys = Array.from(pendingKeys);
+  pendingKeys.clear();
+
+  if (apiKeys.length === 0) return;
+
+  const stats = await renderMany(apiKeys);
+  logger.info('Static content regenerated', stats);
+}
+
+/**
+ * Queue a render on this instance only (debounced)
+ */
+function queueRender(apiKey) {
+  pendingKeys.add(apiKey);
+
+  if (!flushTimer) {
+    flushTimer = setTimeout(() => {
+      flushPending().catch(err =>
+        logger.error('Static content flush failed', { error: err.message })
+      );
+    }, RENDER_CONFIG.debounceMs);
+    // Don't keep the process alive just for a pending render
+    flushTimer.unref();
+  }
+}
+
+/**
+ * Schedule re-render of a site after its placements changed
+ * Fire-and-forget: call next to `wp:content` cache invalidation, after COMMIT
+ * Other instances receive the signal and re-render their own copy
+ * @param {string} apiKey - Site API key
+ */
+function scheduleRender(apiKey) {
+  if (!apiKey || !isEnabled()) return;
+
+  queueRender(apiKey);
+  cache.publish(RENDER_CHANNEL, JSON.stringify({ instanceId, apiKey }));
+}
+
+/**
+ * Handle a render signal published by scheduleRender() on any instance
+ */
+function handleRenderSignal(message) {
+  try {
+    const signal = JSON.parse(message);
+    if (signal.instanceId !== instanceId && signal.apiKey) {
+      queueRender(signal.apiKey);
+    }
+  } catch (error) {
+    logger.warn('Invalid static content render signal', { error: error.message });
+  }
+}
+
+/**
+ * Subscribe to render signals of other instances (call once at server startup)
+ * Signals published while the subscriber was disconnected are lost, so every (re)connect
+ * invalidates older files - they 404 once and are re-rendered on the API fallback
+ */
+function initRenderSync() {
+  if (!isEnabled()) return;
+
+  const subscribed = cache.subscribe(RENDER_CHANNEL, handleRenderSignal, () => {
+    validSince = Date.now();
+    logger.info('Static content render sync connected');
+  });
+
+  if (!subscribed) {
+    logger.warn('Static content render sync unavailable (no Redis) - single instance only');
+  }
+}
+
+/**
+ * Whether a rendered file exists and was written after the last render sync (re)connect
+ * Older files may have missed a render signal from another instance
+ * @param {string} fileName - `<sha256(api_key)>.json`
+ * @returns {Promise<boolean>}
+ */
+async function isCurrent(fileName) {
+  try {
+    const stats = await fs.stat(path.join(getContentDir(), fileName));
+    return stats.mtimeMs >= validSince;
+  } catch (_error) {
+    return false;
+  }
+}
+
+/**
+ * Render a site lazily if it has no current static file
+ * Used by the API fallback path so the fleet fills itself in on first poll
+ * @param {string} apiKey - Site API key
+ */
+async function ensureRendered(apiKey) {
+  if (!apiKey || !isEnabled()) return;
+
+  if (!(await isCurrent(getFileName(apiKey)))) {
+    // Local only - other instances' copies are not affected by this instance's gap
+    queueRender(apiKey);
+  }
+}
+
+/**
+ * Delete files whose API key no longer exists (deleted sites, rotated keys)
+ * @param {Set<string>} validFileNames - File names of current API keys
+ * @returns {Promise<number>} - Number of orphaned sites removed
+ */
+async function removeOrphans(validFileNames) {
+  let files;
+  try {
+    files = await fs.readdir(getContentDir());
+  } catch (error) {
+    if (error.code === 'ENOENT') return 0;
+    throw error;
+  }
+
+  let removed = 0;
+  for (const file of files) {
+    const baseName = file.replace(/\.(gz|br)$/, '');
+    if (!/^[a-f0-9]{64}\.json$/.test(baseName) || validFileNames.has(baseName)) continue;
+
+    await fs.unlink(path.join(getContentDir(), file)).catch(() => {});
+    if (baseName === file) removed++;
+  }
+
+  return removed;
+}
+
+/**
+ * Render every site (initial fill, periodic rebuild, multi-instance resync)
+ * @returns {Promise<{rendered: number, removed: number, failed: number, orphans: number}>}
+ */
+async function renderAllSites() {
+  const result = await query('SELECT api_key FROM sites WHERE api_key IS NOT NULL ORDER BY id');
+  const apiKeys = result.rows.map(row => row.api_key);
+
+  const stats = await renderMany(apiKeys);
+  stats.orphans = await removeOrphans(new Set(apiKeys.map(getFileName)));
+
+  logger.info('Static content full render completed', { sites: apiKeys.length, ...stats });
+  return stats;
+}
+
+module.exports = {
+  getContentDir,
+  getFileName,
+  isCurrent,
+  renderSite,
+  removeSite,
+  scheduleRender,
+  initRenderSync,
+  ensureRendered,
+  renderAllSites,
+  isEnabled
+};
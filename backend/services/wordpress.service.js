@@ -129,6 +129,90 @@ async function validateExternalUrl(url) {
   }
 }
 
+// Load content by API key straight from the database (no caching)
+// Shared by getContentByApiKey and the static content renderer
+const loadContentByApiKey = async apiKey => {
+  // Get all links for sites with this API key
+  // CRITICAL: Only return links that are:
+  // 1. Already placed (status = 'placed')
+  // 2. OR scheduled AND publish date has passed
+  const linksResult = await query(
+    `
+    SELECT
+      pl.id,
+      pl.url,
+      pl.anchor_text,
+      pl.html_context,
+      pl.image_url,
+      pl.link_attributes,
+      pl.wrapper_config,
+      pl.custom_data
+    FROM project_links pl
+    JOIN placement_content pc ON pl.id = pc.link_id
+    JOIN placements plc ON pc.placement_id = plc.id
+    JOIN sites s ON plc.site_id = s.id
+    WHERE s.api_key = $1
+      AND pc.link_id IS NOT NULL
+      AND (plc.status = 'placed'
+           OR (plc.status = 'scheduled' AND plc.scheduled_publish_date <= NOW()))
+    ORDER BY pc.id DESC
+  `,
+    [apiKey]
+  );
+
+  // Get all articles for sites with this API key
+  // CRITICAL: Only return articles that are:
+  // 1. Already placed (status = 'placed')
+  // 2. OR scheduled AND publish date has passed
+  const articlesResult = await query(
+    `
+    SELECT
+      pa.id,
+      pa.title,
+      pa.content,
+      pa.slug,
+      plc.wordpress_post_id
+    FROM project_articles pa
+    JOIN placement_content pc ON pa.id = pc.article_id
+    JOIN placements plc ON pc.placement_id = plc.id
+    JOIN sites s ON plc.site_id = s.id
+    WHERE s.api_key = $1
+      AND pc.article_id IS NOT NULL
+      AND (plc.status = 'placed'
+           OR (plc.status = 'scheduled' AND plc.scheduled_publish_date <= NOW()))
+    ORDER BY pc.id DESC
+  `,
+    [apiKey]
+  );
+
+  // Format response for WordPress plugin
+  const links = linksResult.rows.map(row => ({
+    url: row.url,
+    anchor_text: row.anchor_text,
+    html_context: row.html_context || '',
+    position: '', // Position can be added later if needed
+
+    // Extended fields for flexible rendering
+    image_url: row.image_url || '',
+    link_attributes: row.link_attributes || {},
+    wrapper_config: row.wrapper_config || {},
+    custom_data: row.custom_data || {}
+  }));
+
+  const articles = articlesResult.rows.map(row => ({
+    id: row.id,
+    title: row.title,
+    content: row.content,
+    slug: row.slug,
+    wordpress_post_id: row.wordpress_post_id
+  }));
+
+  return {
+    links: links,
+    articles: articles
+  };
+};
+
 // Get content by API key (with Redis caching)
 const getContentByApiKey = async apiKey => {
   try {
@@ -141,85 +225,8 @@ const getContentByApiKey = async apiKey => {
       return cached;
     }
 
-    // Get all links for sites with this API key
-    // CRITICAL: Only return links that are:
-    // 1. Already placed (status = 'placed')
-    // 2. OR scheduled AND publish date has passed
-    const linksResult = await query(
-      `
-      SELECT
-        pl.id,
-        pl.url,
-        pl.anchor_text,
-        pl.html_context,
-        pl.image_url,
-        pl.link_attributes,
-        pl.wrapper_config,
-        pl.custom_data
-      FROM project_links pl
-      JOIN placement_content pc ON pl.id = pc.link_id
-      JOIN placements plc ON pc.placement_id = plc.id
-      JOIN sites s ON plc.site_id = s.id
-      WHERE s.api_key = $1
-        AND pc.link_id IS NOT NULL
-        AND (plc.status = 'placed'
-             OR (plc.status = 'scheduled' AND plc.scheduled_publish_date <= NOW()))
-      ORDER BY pc.id DESC
-    `,
-      [apiKey]
-    );
-
-    // Get all articles for sites with this API key
-    // CRITICAL: Only return articles that are:
-    // 1. Already placed (status = 'placed')
-    // 2. OR scheduled AND publish date has passed
-    const articlesResult = await query(
-      `
-      SELECT
-        pa.id,
-        pa.title,
-        pa.content,
-        pa.slug,
-        plc.wordpress_post_id
-      FROM project_articles pa
-      JOIN placement_content pc ON pa.id = pc.article_id
-      JOIN placements plc ON pc.placement_id = plc.id
-      JOIN sites s ON plc.site_id = s.id
-      WHERE s.api_key = $1
-        AND pc.article_id IS NOT NULL
-        AND (plc.status = 'placed'
-             OR (plc.status = 'scheduled' AND plc.scheduled_publish_date <= NOW()))
-      ORDER BY pc.id DESC
-    `,
-      [apiKey]
-    );
-
-    // Format response for WordPress plugin
-    const links = linksResult.rows.map(row => ({
-      url: row.url,
-      anchor_text: row.anchor_text,
-      html_context: row.html_context || '',
-      position: '', // Position can be added later if needed
-
-      // Extended fields for flexible rendering
-      image_url: row.image_url || '',
-      link_attributes: row.link_attributes || {},
-      wrapper_config: row.wrapper_config || {},
-      custom_data: row.custom_data || {}
-    }));
-
-    const articles = articlesResult.rows.map(row => ({
-      id: row.id,
-      title: row.title,
-      content: row.content,
-      slug: row.slug,
-      wordpress_post_id: row.wordpress_post_id
-    }));
-
-    const response = {
-      links: links,
-      articles: articles
-    };
+    const response = await loadContentByApiKey(apiKey);
+    const { links, articles } = response;
 
     // Cache for 5 minutes
     await cache.set(cacheKey, response, 300);
@@ -542,14 +549,22 @@ const getEndpointUpdate = async apiKey => {
 
 /**
  * Mark endpoint update as confirmed for a site
+ * Increments the migration's confirmed_sites counter in the same statement
  */
 const confirmEndpointUpdate = async apiKey => {
   try {
     await query(
-      `UPDATE site_endpoint_updates seu
-       SET status = 'confirmed', confirmed_at = NOW()
-       FROM sites s
-       WHERE seu.site_id = s.id AND s.api_key = $1 AND seu.status = 'pending'`,
+      `WITH confirmed AS (
+         UPDATE site_endpoint_updates seu
+         SET status = 'confirmed', confirmed_at = NOW()
+         FROM sites s
+         WHERE seu.site_id = s.id AND s.api_key = $1 AND seu.status = 'pending'
+         RETURNING seu.migration_id
+       )
+       UPDATE endpoint_migrations em
+       SET confirmed_sites = em.confirmed_sites + 1
+       FROM confirmed c
+       WHERE em.id = c.migration_id`,
       [apiKey]
     );
     return true;
@@ -561,6 +576,7 @@ const confirmEndpointUpdate = async apiKey => {
 
 module.exports = {
   getContentByApiKey,
+  loadContentByApiKey,
   getContentByDomain,
   publishArticle,
   deleteArticle,
@@ -0,0 +1,183 @@
+/**
+ * Anonymized traffic capture for load replay (testsprite_tests/traffic_replay.py)
+ * Enabled only when TRAFFIC_CAPTURE_FILE is set - appends one JSON line per API request
+ *
+ * SECURITY: Never records bodies, headers or credentials
+ * - Query values of sensitive keys are dropped, api_key is replaced by a short sha256 ref
+ * - Credential path segments (email tokens, static content hashes) become placeholders
+ * - Responses are recorded as a shape (JSON paths -> types), never values
+ */
+
+const fs = require('fs');
+const crypto = require('crypto');
+
+// Query keys whose values must never reach the capture file
+const SENSITIVE_KEY_PATTERN = /token|password|secret|key|email|code|signature/i;
+
+// Path segments that are credentials themselves (same rules as traffic_replay.py)
+// - `<sha256(api_key)>.json` static content files -> ':hash.json' (kept only as api_key_ref)
+// - UUIDs and long random tokens -> ':uuid' / ':token'
+const CREDENTIAL_SEGMENT_PATTERNS = [
+  { pattern: /^[a-f0-9]{64}\.json$/, placeholder: ':hash.json' },
+  { pattern: /^[0-9a-f]{8}-[0-9a-f-]{27}$/i, placeholder: ':uuid' },
+  { pattern: /^(?=.*\d)[A-Za-z0-9_-]{24,}$/, placeholder: ':token' }
+];
+
+// Any segment after one of these is a token whatever its format (e.g. /verify-email/:token)
+// except numeric ids (e.g. DELETE /api/sites/tokens/:id)
+const CREDENTIAL_PARENT_PATTERN = /verify|reset|token|secret/i;
+const NUMERIC_SEGMENT_PATTERN = /^[0-9]+$/;
+
+// Shape limits (keep capture lines small)
+const SHAPE_MAX_DEPTH = 6;
+const SHAPE_MAX_KEYS = 50;
+
+let stream = null;
+
+/**
+ * Whether capture is enabled
+ */
+const isEnabled = () => Boolean(process.env.TRAFFIC_CAPTURE_FILE);
+
+/**
+ * Short stable reference for a credential (lets replay map captured sites to staging keys)
+ */
+const credentialRef = value =>
+  crypto.createHash('sha256').update(String(value)).digest('hex').slice(0, 12);
+
+/**
+ * Type name of a JSON value
+ */
+const typeOf = value => {
+  if (value === null || value === undefined) return 'null';
+  if (Array.isArray(value)) return 'array';
+  return typeof value;
+};
+
+/**
+ * Flatten JSON value into { path: type } (arrays described by their first element)
+ * Same algorithm as response_shape() in traffic_replay.py
+ * @example getShape({ links: [{ url: 'x' }] }) => { $: 'object', '$.links': 'array', '$.links[]': 'object', '$.links[].url': 'string' }
+ */
+function getShape(value, path = '$', depth = 0, shape = {}) {
+  const type = typeOf(value);
+  shape[path] = type;
+
+  if (depth >= SHAPE_MAX_DEPTH) return shape;
+
+  if (type === 'array' && value.length > 0) {
+    getShape(value[0], `${path}[]`, depth + 1, shape);
+  } else if (type === 'object') {
+    Object.keys(value)
+      .sort()
+      .slice(0, SHAPE_MAX_KEYS)
+      .forEach(key => getShape(value[key], `${path}.${key}`, depth + 1, shape));
+  }
+
+  return shape;
+}
+
+/**
+ * Anonymize query string: drop sensitive values, keep keys for endpoint identity
+ */
+function anonymizeQuery(query = {}) {
+  const result = {};
+
+  Object.keys(query).forEach(key => {
+    result[key] = SENSITIVE_KEY_PATTERN.test(key) ? '' : String(query[key]).slice(0, 100);
+  });
+
+  return result;
+}
+
+/**
+ * Replace credential path segments with placeholders
+ * @returns {{ path: string, hashRef: string|null }} - hashRef: api_key_ref of a static content file
+ */
+function anonymizePath(path) {
+  let hashRef = null;
+
+  const segments = path.split('/').map((segment, index, all) => {
+    // Parent rule checks the original segment - a redacted ':token' must not cascade
+    if (
+      index > 1 &&
+      segment &&
+      !NUMERIC_SEGMENT_PATTERN.test(segment) &&
+      CREDENTIAL_PARENT_PATTERN.test(all[index - 1])
+    ) {
+      return ':token';
+    }
+
+    const rule = CREDENTIAL_SEGMENT_PATTERNS.find(({ pattern }) => pattern.test(segment));
+    if (!rule) return segment;
+
+    // File name is sha256(api_key) - its prefix equals credentialRef(api_key)
+    if (rule.placeholder === ':hash.json') hashRef = segment.slice(0, 12);
+    return rule.placeholder;
+  });
+
+  return { path: segments.join('/'), hashRef };
+}
+
+/**
+ * Build capture record for a finished request
+ */
+function buildRecord(req, res, durationMs, responseShape) {
+  const apiKey = req.headers['x-api-key'] || req.query?.api_key || req.body?.api_key;
+  const { path, hashRef } = anonymizePath(req.originalUrl.split('?')[0]);
+
+  let auth = null;
+  if (req.headers.authorization) auth = 'bearer';
+  else if (apiKey) auth = 'api_key';
+  else if (hashRef) auth = 'static_hash';
+
+  return {
+    ts: new Date(Date.now() - durationMs).toISOString(),
+    method: req.method,
+    path,
+    query: anonymizeQuery(req.query),
+    auth,
+    api_key_ref: apiKey ? credentialRef(apiKey) : hashRef,
+    status: res.statusCode,
+    duration_ms: durationMs,
+    bytes: parseInt(res.getHeader('Content-Length'), 10) || null,
+    shape: responseShape
+  };
+}
+
+/**
+ * Wrap res.json to remember the response shape (call before the route handler runs)
+ */
+function attachShapeRecorder(res) {
+  const originalJson = res.json.bind(res);
+
+  res.json = body => {
+    res.locals.captureShape = getShape(body);
+    return originalJson(body);
+  };
+}
+
+/**
+ * Append capture record (non-blocking, errors disable capture silently)
+ */
+function writeRecord(record) {
+  if (!stream) {
+    stream = fs.createWriteStream(process.env.TRAFFIC_CAPTURE_FILE, { flags: 'a' });
+    stream.on('error', () => {
+      stream = null;
+      delete process.env.TRAFFIC_CAPTURE_FILE;
+    });
+  }
+
+  stream.write(JSON.stringify(record) + '\n');
+}
+
+module.exports = {
+  isEnabled,
+  getShape,
+  anonymizeQuery,
+  anonymizePath,
+  buildRecord,
+  attachShapeRecorder,
+  writeRecord
+};
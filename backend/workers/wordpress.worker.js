@@ -25,6 +25,7 @@ const logger = require('../config/logger');
 const { query, pool } = require('../config/database');
 const wordpressService = require('../services/wordpress.service');
 const cache = require('../services/cache.service');
+const staticContentService = require('../services/static-content.service');
 
 module.exports = async function wordpressWorker(job) {
   const startTime = Date.now();
@@ -156,6 +157,7 @@ module.exports = async function wordpressWorker(job) {
     const affectedApiKeys = [...new Set(placements.map(p => p.apiKey).filter(Boolean))];
     for (const apiKey of affectedApiKeys) {
       await cache.del(`wp:content:${apiKey}`);
+      staticContentService.scheduleRender(apiKey);
     }
     logger.debug('Cache invalidated for affected sites', {
       jobId: job.id,
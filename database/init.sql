@@ -92,6 +92,19 @@ CREATE TABLE placement_content (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- 8. endpoint_migrations (one row per endpoint broadcast, incremental progress counters)
+CREATE TABLE endpoint_migrations (
+    id SERIAL PRIMARY KEY,
+    new_endpoint VARCHAR(500) NOT NULL,
+    cohort_type VARCHAR(20) NOT NULL DEFAULT 'all',
+    cohort_percentage INTEGER,
+    total_sites INTEGER NOT NULL DEFAULT 0,
+    confirmed_sites INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT endpoint_migrations_cohort_type_check CHECK (cohort_type IN ('all', 'percentage', 'sites')),
+    CONSTRAINT endpoint_migrations_percentage_check CHECK (cohort_percentage IS NULL OR cohort_percentage BETWEEN 1 AND 100)
+);
+
 -- 9. site_endpoint_updates (for bulk API endpoint migration)
 CREATE TABLE site_endpoint_updates (
     id SERIAL PRIMARY KEY,
@@ -100,6 +113,7 @@ CREATE TABLE site_endpoint_updates (
     status VARCHAR(20) DEFAULT 'pending',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     confirmed_at TIMESTAMP,
+    migration_id INTEGER REFERENCES endpoint_migrations(id) ON DELETE SET NULL,
     CONSTRAINT unique_site_endpoint_update UNIQUE (site_id)
 );
 
@@ -117,3 +131,5 @@ CREATE INDEX idx_placement_content_link_id ON placement_content(link_id) WHERE l
 CREATE INDEX idx_placement_content_article_id ON placement_content(article_id) WHERE article_id IS NOT NULL;
 CREATE INDEX idx_endpoint_updates_status ON site_endpoint_updates(status);
 CREATE INDEX idx_endpoint_updates_site_id ON site_endpoint_updates(site_id);
+CREATE INDEX idx_endpoint_updates_migration_id ON site_endpoint_updates(migration_id);
+CREATE INDEX idx_endpoint_migrations_created_at ON endpoint_migrations(created_at DESC);
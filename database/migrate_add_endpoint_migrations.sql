@@ -0,0 +1,46 @@
+-- Migration: Add endpoint_migrations table for cohort rollout and incremental progress counters
+-- Version: 2.8.0
+-- Date: 2026-10-18
+
+-- One row per broadcast (cohort of sites receiving a new endpoint)
+CREATE TABLE IF NOT EXISTS endpoint_migrations (
+    id SERIAL PRIMARY KEY,
+    new_endpoint VARCHAR(500) NOT NULL,
+    cohort_type VARCHAR(20) NOT NULL DEFAULT 'all',
+    cohort_percentage INTEGER,
+    total_sites INTEGER NOT NULL DEFAULT 0,
+    confirmed_sites INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT endpoint_migrations_cohort_type_check CHECK (cohort_type IN ('all', 'percentage', 'sites')),
+    CONSTRAINT endpoint_migrations_percentage_check CHECK (cohort_percentage IS NULL OR cohort_percentage BETWEEN 1 AND 100)
+);
+
+-- Link each per-site update to the broadcast that created it
+ALTER TABLE site_endpoint_updates
+    ADD COLUMN IF NOT EXISTS migration_id INTEGER REFERENCES endpoint_migrations(id) ON DELETE SET NULL;
+
+CREATE INDEX IF NOT EXISTS idx_endpoint_updates_migration_id ON site_endpoint_updates(migration_id);
+CREATE INDEX IF NOT EXISTS idx_endpoint_migrations_created_at ON endpoint_migrations(created_at DESC);
+
+-- Backfill: one migration per endpoint already broadcast (counters computed once here)
+INSERT INTO endpoint_migrations (new_endpoint, cohort_type, total_sites, confirmed_sites, created_at)
+SELECT
+    new_endpoint,
+    'all',
+    COUNT(*),
+    COUNT(*) FILTER (WHERE status = 'confirmed'),
+    MAX(created_at)
+FROM site_endpoint_updates
+WHERE migration_id IS NULL
+GROUP BY new_endpoint;
+
+UPDATE site_endpoint_updates seu
+SET migration_id = em.id
+FROM endpoint_migrations em
+WHERE seu.migration_id IS NULL
+  AND em.new_endpoint = seu.new_endpoint;
+
+-- Comments
+COMMENT ON TABLE endpoint_migrations IS 'Endpoint broadcasts with incrementally maintained progress counters';
+COMMENT ON COLUMN endpoint_migrations.total_sites IS 'Sites currently assigned to this migration (incremented on broadcast, decremented when superseded)';
+COMMENT ON COLUMN endpoint_migrations.confirmed_sites IS 'Sites that confirmed (incremented by confirm-endpoint-update)';
@@ -0,0 +1,41 @@
+/**
+ * Migration: Add endpoint_migrations table (cohort rollout + progress counters)
+ * Run with: node database/run_endpoint_migrations_migration.js
+ */
+
+const fs = require('fs');
+const path = require('path');
+const { query } = require('../backend/config/database');
+
+async function runMigration() {
+  console.log('Starting endpoint migrations migration...');
+
+  try {
+    // Read migration SQL
+    const migrationPath = path.join(__dirname, 'migrate_add_endpoint_migrations.sql');
+    const migrationSQL = fs.readFileSync(migrationPath, 'utf8');
+
+    console.log('Creating endpoint_migrations table and backfilling counters...');
+    await query(migrationSQL);
+    console.log('  Table created');
+
+    const result = await query(
+      'SELECT id, new_endpoint, total_sites, confirmed_sites FROM endpoint_migrations ORDER BY id'
+    );
+    console.log(`  Migrations tracked: ${result.rows.length}`);
+    result.rows.forEach(row => {
+      console.log(
+        `    #${row.id} ${row.new_endpoint}: ${row.confirmed_sites}/${row.total_sites} confirmed`
+      );
+    });
+
+    console.log('\nMigration completed successfully!');
+  } catch (error) {
+    console.error('Migration failed:', error.message);
+    process.exit(1);
+  }
+
+  process.exit(0);
+}
+
+runMigration();
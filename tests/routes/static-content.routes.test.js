@@ -0,0 +1,163 @@
+/**
+ * Static Content Routes Tests
+ *
+ * Tests GET /api/static-content/:hash.json behind the app's compression() middleware:
+ * - Accept-Encoding negotiation (br preferred, gzip, identity)
+ * - Content-Encoding, Vary and Cache-Control headers
+ * - Precompressed files sent as-is (not compressed again)
+ * - 404 for missing files and files from before the last render sync (re)connect
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const zlib = require('zlib');
+const express = require('express');
+const compression = require('compression');
+const request = require('supertest');
+
+// Mock database
+jest.mock('../../backend/config/database', () => ({
+  query: jest.fn()
+}));
+
+// Mock logger
+jest.mock('../../backend/config/logger', () => ({
+  info: jest.fn(),
+  error: jest.fn(),
+  warn: jest.fn(),
+  debug: jest.fn()
+}));
+
+// Mock WordPress service (not used by the route itself)
+jest.mock('../../backend/services/wordpress.service', () => ({
+  loadContentByApiKey: jest.fn(),
+  getEndpointUpdate: jest.fn()
+}));
+
+// Mock cache service (render sync pub/sub)
+jest.mock('../../backend/services/cache.service', () => ({
+  publish: jest.fn().mockResolvedValue(true),
+  subscribe: jest.fn().mockReturnValue(true)
+}));
+
+const staticContentService = require('../../backend/services/static-content.service');
+const staticContentRoutes = require('../../backend/routes/static-content.routes');
+
+// Collect raw response bytes (no JSON parsing of compressed bodies)
+const rawParser = (res, callback) => {
+  const chunks = [];
+  res.on('data', chunk => chunks.push(chunk));
+  res.on('end', () => callback(null, Buffer.concat(chunks)));
+};
+
+describe('Static Content Routes', () => {
+  const apiKey = 'api_test123';
+  const fileName = staticContentService.getFileName(apiKey);
+  // Larger than the compression() threshold (1kb) so a second compression would kick in
+  const payload = {
+    links: Array.from({ length: 40 }, (_, i) => ({
+      url: `https://example.com/page-${i}`,
+      anchor_text: `Example anchor ${i}`
+    })),
+    articles: [],
+    endpoint_update: null
+  };
+  const body = Buffer.from(JSON.stringify(payload));
+
+  let app;
+  let contentDir;
+  let basePath;
+
+  beforeEach(() => {
+    contentDir = fs.mkdtempSync(path.join(os.tmpdir(), 'static-content-routes-'));
+    process.env.STATIC_CONTENT_DIR = contentDir;
+
+    basePath = path.join(contentDir, fileName);
+    fs.writeFileSync(`${basePath}.gz`, zlib.gzipSync(body));
+    fs.writeFileSync(`${basePath}.br`, zlib.brotliCompressSync(body));
+    fs.writeFileSync(basePath, body);
+
+    // Same middleware order as app.js
+    app = express();
+    app.use(compression());
+    app.use('/api/static-content', staticContentRoutes);
+  });
+
+  afterEach(() => {
+    fs.rmSync(contentDir, { recursive: true, force: true });
+    delete process.env.STATIC_CONTENT_DIR;
+  });
+
+  describe('GET /api/static-content/:hash.json', () => {
+    it('should prefer brotli and send the precompressed file as-is', async () => {
+      const res = await request(app)
+        .get(`/api/static-content/${fileName}`)
+        .set('Accept-Encoding', 'gzip, deflate, br')
+        .buffer(true)
+        .parse(rawParser);
+
+      expect(res.status).toBe(200);
+      expect(res.headers['content-encoding']).toBe('br');
+      expect(res.headers['content-length']).toBe(String(fs.statSync(`${basePath}.br`).size));
+      expect(res.headers['content-type']).toBe('application/json; charset=utf-8');
+      expect(res.headers['cache-control']).toBe('public, max-age=60, stale-while-revalidate=300');
+      expect(res.headers.vary).toContain('Accept-Encoding');
+    });
+
+    it('should serve gzip when brotli is not accepted', async () => {
+      const res = await request(app)
+        .get(`/api/static-content/${fileName}`)
+        .set('Accept-Encoding', 'gzip');
+
+      expect(res.status).toBe(200);
+      expect(res.headers['content-encoding']).toBe('gzip');
+      expect(res.headers.vary).toContain('Accept-Encoding');
+      // Decoded once by the client - compression() did not gzip the gzip file again
+      expect(res.body).toEqual(payload);
+    });
+
+    it('should serve identity file without Content-Encoding', async () => {
+      const res = await request(app)
+        .get(`/api/static-content/${fileName}`)
+        .set('Accept-Encoding', 'identity')
+        .buffer(true)
+        .parse(rawParser);
+
+      expect(res.status).toBe(200);
+      expect(res.headers['content-encoding']).toBeUndefined();
+      expect(res.headers['content-length']).toBe(String(body.length));
+      expect(res.headers.vary).toContain('Accept-Encoding');
+      expect(res.body.equals(body)).toBe(true);
+    });
+
+    it('should return 404 when the site is not rendered yet', async () => {
+      const missing = staticContentService.getFileName('api_missing');
+
+      const res = await request(app).get(`/api/static-content/${missing}`);
+
+      expect(res.status).toBe(404);
+      expect(res.body).toEqual({ error: 'Static content not found' });
+    });
+
+    it('should return 404 for files written before the last render sync connect', async () => {
+      // Rendered by a previous process - render signals since then were not received
+      const past = new Date(Date.now() - 60 * 1000);
+      fs.utimesSync(basePath, past, past);
+
+      const res = await request(app)
+        .get(`/api/static-content/${fileName}`)
+        .set('Accept-Encoding', 'gzip');
+
+      expect(res.status).toBe(404);
+      expect(res.body).toEqual({ error: 'Static content not found' });
+    });
+
+    it('should not match file names that are not a sha256 hash', async () => {
+      const res = await request(app).get('/api/static-content/api_test123.json');
+
+      expect(res.status).toBe(404);
+      expect(res.body).toEqual({});
+    });
+  });
+});
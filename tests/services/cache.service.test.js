@@ -123,6 +123,11 @@ describe('Cache Service', () => {
       expect(typeof cacheService.getStats).toBe('function');
     });
 
+    it('should export publish and subscribe functions', () => {
+      expect(typeof cacheService.publish).toBe('function');
+      expect(typeof cacheService.subscribe).toBe('function');
+    });
+
     it('should export isAvailable function', () => {
       expect(typeof cacheService.isAvailable).toBe('function');
     });
@@ -260,7 +265,9 @@ describe('Cache Service - Active Redis operations', () => {
       del: jest.fn(),
       scan: jest.fn(),
       info: jest.fn(),
-      dbsize: jest.fn()
+      dbsize: jest.fn(),
+      publish: jest.fn(),
+      duplicate: jest.fn()
     };
 
     jest.doMock('ioredis', () => {
@@ -413,6 +420,51 @@ describe('Cache Service - Active Redis operations', () => {
     });
   });
 
+  describe('publish', () => {
+    it('should publish message to channel', async () => {
+      mockRedisInstance.publish.mockResolvedValue(2);
+
+      const result = await cacheService.publish('test-channel', 'message');
+
+      expect(result).toBe(true);
+      expect(mockRedisInstance.publish).toHaveBeenCalledWith('test-channel', 'message');
+    });
+
+    it('should return false on publish error', async () => {
+      mockRedisInstance.publish.mockRejectedValue(new Error('Redis error'));
+
+      const result = await cacheService.publish('test-channel', 'message');
+
+      expect(result).toBe(false);
+    });
+  });
+
+  describe('subscribe', () => {
+    it('should deliver messages of the channel on a dedicated connection', () => {
+      const handlers = {};
+      const subscriber = {
+        on: jest.fn((event, callback) => {
+          handlers[event] = callback;
+        }),
+        subscribe: jest.fn().mockResolvedValue(1)
+      };
+      mockRedisInstance.duplicate.mockReturnValue(subscriber);
+      const onMessage = jest.fn();
+      const onReady = jest.fn();
+
+      const result = cacheService.subscribe('test-channel', onMessage, onReady);
+      handlers.message('other-channel', 'ignored');
+      handlers.message('test-channel', 'message');
+      handlers.ready();
+
+      expect(result).toBe(true);
+      expect(subscriber.subscribe).toHaveBeenCalledWith('test-channel');
+      expect(onMessage).toHaveBeenCalledTimes(1);
+      expect(onMessage).toHaveBeenCalledWith('message');
+      expect(onReady).toHaveBeenCalled();
+    });
+  });
+
   describe('isAvailable', () => {
     it('should return true when connected', () => {
       expect(cacheService.isAvailable()).toBe(true);
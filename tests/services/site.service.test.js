@@ -265,8 +265,12 @@ describe('Site Service', () => {
       mockClient.query
         .mockResolvedValueOnce({}) // BEGIN
         .mockResolvedValueOnce({ rows: [{ id: 1, site_url: 'https://example.com' }] }) // SELECT site FOR UPDATE
+        .mockResolvedValueOnce({ rows: [{ count: '0' }] }) // Active placements check
         .mockResolvedValueOnce({ rows: [] }) // SELECT placements (none)
+        .mockResolvedValueOnce({}) // UPDATE site quotas
+        .mockResolvedValueOnce({}) // UPDATE endpoint_migrations counters
         .mockResolvedValueOnce({}) // DELETE site
+        .mockResolvedValueOnce({}) // INSERT audit_log
         .mockResolvedValueOnce({}); // COMMIT
 
       const result = await siteService.deleteSite(1, 1);
@@ -274,6 +278,31 @@ describe('Site Service', () => {
       expect(result).toHaveProperty('deleted', true);
     });
 
+    it('should release endpoint migration counters before cascade delete', async () => {
+      mockClient.query
+        .mockResolvedValueOnce({}) // BEGIN
+        .mockResolvedValueOnce({ rows: [{ id: 1, site_url: 'https://example.com' }] })
+        .mockResolvedValueOnce({ rows: [{ count: '0' }] })
+        .mockResolvedValueOnce({ rows: [] })
+        .mockResolvedValueOnce({})
+        .mockResolvedValueOnce({}) // UPDATE endpoint_migrations counters
+        .mockResolvedValueOnce({}) // DELETE site
+        .mockResolvedValueOnce({})
+        .mockResolvedValueOnce({});
+
+      await siteService.deleteSite(1, 1);
+
+      const sqls = mockClient.query.mock.calls.map(call => call[0]);
+      const counterIndex = sqls.findIndex(sql => sql.includes('UPDATE endpoint_migrations'));
+      const deleteIndex = sqls.findIndex(sql => sql.includes('DELETE FROM sites'));
+
+      expect(counterIndex).toBeGreaterThan(-1);
+      expect(counterIndex).toBeLessThan(deleteIndex);
+      expect(sqls[counterIndex]).toContain('total_sites = GREATEST(0, em.total_sites - 1)');
+      expect(sqls[counterIndex]).toContain("(seu.status = 'confirmed')::int");
+      expect(mockClient.query.mock.calls[counterIndex][1]).toEqual([1]);
+    });
+
     it('should return {deleted: false} for non-existent site', async () => {
       mockClient.query
         .mockResolvedValueOnce({}) // BEGIN
@@ -946,3 +975,191 @@ describe('Bulk Operations - Additional Tests', () => {
     });
   });
 });
+
+describe('Endpoint Migration', () => {
+  beforeEach(() => {
+    mockQuery.mockReset();
+  });
+
+  describe('broadcastEndpoint', () => {
+    it('should upsert all sites in one statement and create migration', async () => {
+      mockQuery
+        .mockResolvedValueOnce({ rows: [{ id: 7 }] }) // INSERT endpoint_migrations
+        .mockResolvedValueOnce({
+          rows: [{ last_site_id: 3, batch_size: 3, upserted_count: 3, api_keys: ['a', 'b', 'c'] }]
+        });
+
+      const result = await siteService.broadcastEndpoint('https://new.example.com/api');
+
+      expect(result.updated).toBe(3);
+      expect(result.migrationId).toBe(7);
+      // One migration insert + one set-based upsert (no per-site queries)
+      expect(mockQuery).toHaveBeenCalledTimes(2);
+      expect(mockQuery.mock.calls[0][1]).toEqual(['https://new.example.com/api', 'all', null]);
+      expect(mockQuery.mock.calls[1][0]).toContain('ON CONFLICT (site_id) DO UPDATE');
+      expect(mockQuery.mock.calls[1][1]).toEqual(['https://new.example.com/api', 7, 0]);
+    });
+
+    it('should lock existing update rows of the batch before counting superseded ones', async () => {
+      mockQuery
+        .mockResolvedValueOnce({ rows: [{ id: 7 }] }) // INSERT endpoint_migrations
+        .mockResolvedValueOnce({
+          rows: [{ last_site_id: 3, batch_size: 3, upserted_count: 3, api_keys: [] }]
+        });
+
+      await siteService.broadcastEndpoint('https://new.example.com/api');
+
+      // Concurrent confirmEndpointUpdate must not leave the old migration with confirmed > total
+      const batchSql = mockQuery.mock.calls[1][0];
+      expect(batchSql).toContain('FOR UPDATE OF seu');
+      expect(batchSql).toContain('FROM locked l');
+      expect(batchSql.indexOf('FOR UPDATE OF seu')).toBeLessThan(batchSql.indexOf('ON CONFLICT'));
+    });
+
+    it('should continue in keyset batches for large fleets', async () => {
+      mockQuery
+        .mockResolvedValueOnce({ rows: [{ id: 8 }] })
+        .mockResolvedValueOnce({
+          rows: [{ last_site_id: 5000, batch_size: 5000, upserted_count: 5000, api_keys: [] }]
+        })
+        .mockResolvedValueOnce({
+          rows: [{ last_site_id: 5002, batch_size: 2, upserted_count: 1, api_keys: [] }]
+        });
+
+      const result = await siteService.broadcastEndpoint('https://new.example.com/api');
+
+      expect(result.updated).toBe(5001);
+      expect(mockQuery).toHaveBeenCalledTimes(3);
+      expect(mockQuery.mock.calls[2][1][2]).toBe(5000); // cursor = last site id of previous batch
+    });
+
+    it('should filter percentage cohort by site id', async () => {
+      mockQuery.mockResolvedValueOnce({ rows: [{ id: 9 }] }).mockResolvedValueOnce({
+        rows: [{ last_site_id: null, batch_size: 0, upserted_count: 0, api_keys: [] }]
+      });
+
+      const result = await siteService.broadcastEndpoint('https://new.example.com/api', {
+        type: 'percentage',
+        percentage: 10
+      });
+
+      expect(result.updated).toBe(0);
+      expect(mockQuery.mock.calls[0][1]).toEqual(['https://new.example.com/api', 'percentage', 10]);
+      expect(mockQuery.mock.calls[1][0]).toContain('s.id % 100 < $4');
+      expect(mockQuery.mock.calls[1][1][3]).toBe(10);
+    });
+
+    it('should filter site list cohort', async () => {
+      mockQuery.mockResolvedValueOnce({ rows: [{ id: 10 }] }).mockResolvedValueOnce({
+        rows: [{ last_site_id: 5, batch_size: 2, upserted_count: 2, api_keys: [] }]
+      });
+
+      await siteService.broadcastEndpoint('https://new.example.com/api', {
+        type: 'sites',
+        siteIds: ['5', 2, 2]
+      });
+
+      expect(mockQuery.mock.calls[1][0]).toContain('s.id = ANY($4::int[])');
+      expect(mockQuery.mock.calls[1][1][3]).toEqual([5, 2]);
+    });
+
+    it('should not leave an empty migration when no site is queued', async () => {
+      mockQuery
+        .mockResolvedValueOnce({ rows: [{ id: 11 }] })
+        .mockResolvedValueOnce({
+          rows: [{ last_site_id: 4, batch_size: 2, upserted_count: 0, api_keys: [] }]
+        })
+        .mockResolvedValueOnce({ rowCount: 1 }); // DELETE endpoint_migrations
+
+      const result = await siteService.broadcastEndpoint('https://new.example.com/api', {
+        type: 'sites',
+        siteIds: [3, 4]
+      });
+
+      expect(result).toEqual({
+        updated: 0,
+        migrationId: null,
+        message: 'All sites already confirmed this endpoint'
+      });
+      expect(mockQuery.mock.calls[2][0]).toContain('DELETE FROM endpoint_migrations');
+      expect(mockQuery.mock.calls[2][1]).toEqual([11]);
+    });
+
+    it('should keep applied batches and report migration when a later batch fails', async () => {
+      mockQuery
+        .mockResolvedValueOnce({ rows: [{ id: 12 }] })
+        .mockResolvedValueOnce({
+          rows: [{ last_site_id: 5000, batch_size: 5000, upserted_count: 5000, api_keys: [] }]
+        })
+        .mockRejectedValueOnce(new Error('Deadlock detected'));
+
+      const error = await siteService
+        .broadcastEndpoint('https://new.example.com/api')
+        .catch(err => err);
+
+      expect(error.message).toBe('Deadlock detected');
+      expect(error.migrationId).toBe(12);
+      expect(error.lastSiteId).toBe(5000);
+      // Partially applied migration is not deleted
+      expect(mockQuery).toHaveBeenCalledTimes(3);
+    });
+
+    it('should reject invalid endpoint URL', async () => {
+      await expect(siteService.broadcastEndpoint('not-a-url')).rejects.toThrow(
+        'Invalid endpoint URL'
+      );
+      expect(mockQuery).not.toHaveBeenCalled();
+    });
+
+    it('should reject invalid cohort', async () => {
+      await expect(
+        siteService.broadcastEndpoint('https://new.example.com/api', {
+          type: 'percentage',
+          percentage: 150
+        })
+      ).rejects.toThrow(/between 1 and 100/);
+      await expect(
+        siteService.broadcastEndpoint('https://new.example.com/api', { type: 'sites', siteIds: [] })
+      ).rejects.toThrow(/empty/);
+      expect(mockQuery).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('getEndpointMigrationStatus', () => {
+    it('should read counters of latest migration', async () => {
+      mockQuery.mockResolvedValueOnce({
+        rows: [
+          {
+            id: 7,
+            new_endpoint: 'https://new.example.com/api',
+            cohort_type: 'percentage',
+            cohort_percentage: 25,
+            total_sites: 40,
+            confirmed_sites: 30,
+            created_at: '2026-10-18T00:00:00Z'
+          }
+        ]
+      });
+
+      const status = await siteService.getEndpointMigrationStatus();
+
+      expect(status).toMatchObject({
+        migration_id: 7,
+        total: 40,
+        confirmed: 30,
+        pending: 10,
+        cohort_type: 'percentage',
+        cohort_percentage: 25
+      });
+      expect(mockQuery.mock.calls[0][0]).not.toContain('COUNT(');
+    });
+
+    it('should return empty status when no migrations exist', async () => {
+      mockQuery.mockResolvedValueOnce({ rows: [] });
+
+      const status = await siteService.getEndpointMigrationStatus();
+
+      expect(status).toEqual({ pending: 0, confirmed: 0, total: 0, new_endpoint: null });
+    });
+  });
+});
@@ -0,0 +1,253 @@
+/**
+ * Static Content Service Tests
+ *
+ * Tests pre-rendered content files with mocked database and WordPress service:
+ * - getFileName (hashed API key)
+ * - renderSite (identity/gzip/brotli files, payload shape)
+ * - renderSite for deleted site (files removed)
+ * - isCurrent (missing files, files from before a render sync reconnect)
+ * - renderAllSites (orphan cleanup)
+ * - scheduleRender disabled via STATIC_CONTENT_ENABLED, render signal published
+ * - initRenderSync (renders announced by other instances)
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const zlib = require('zlib');
+const crypto = require('crypto');
+
+// Mock database
+const mockQuery = jest.fn();
+
+jest.mock('../../backend/config/database', () => ({
+  query: (...args) => mockQuery(...args)
+}));
+
+// Mock logger
+jest.mock('../../backend/config/logger', () => ({
+  info: jest.fn(),
+  error: jest.fn(),
+  warn: jest.fn(),
+  debug: jest.fn()
+}));
+
+// Mock WordPress service (content loader + endpoint update)
+jest.mock('../../backend/services/wordpress.service', () => ({
+  loadContentByApiKey: jest.fn(),
+  getEndpointUpdate: jest.fn()
+}));
+
+// Mock cache service (render sync pub/sub)
+jest.mock('../../backend/services/cache.service', () => ({
+  publish: jest.fn().mockResolvedValue(true),
+  subscribe: jest.fn().mockReturnValue(true)
+}));
+
+const cache = require('../../backend/services/cache.service');
+const wordpressService = require('../../backend/services/wordpress.service');
+const staticContentService = require('../../backend/services/static-content.service');
+
+describe('Static Content Service', () => {
+  const apiKey = 'api_test123';
+  const mockContent = {
+    links: [{ url: 'https://example.com', anchor_text: 'Example' }],
+    articles: []
+  };
+  let contentDir;
+
+  beforeEach(() => {
+    contentDir = fs.mkdtempSync(path.join(os.tmpdir(), 'static-content-'));
+    process.env.STATIC_CONTENT_DIR = contentDir;
+    jest.clearAllMocks();
+    mockQuery.mockReset();
+    delete process.env.STATIC_CONTENT_ENABLED;
+    wordpressService.loadContentByApiKey.mockResolvedValue(mockContent);
+    wordpressService.getEndpointUpdate.mockResolvedValue(null);
+  });
+
+  afterEach(() => {
+    fs.rmSync(contentDir, { recursive: true, force: true });
+    delete process.env.STATIC_CONTENT_DIR;
+  });
+
+  describe('getFileName', () => {
+    it('should use sha256 of API key instead of the key itself', () => {
+      const expected = crypto.createHash('sha256').update(apiKey).digest('hex') + '.json';
+
+      expect(staticContentService.getFileName(apiKey)).toBe(expected);
+      expect(staticContentService.getFileName(apiKey)).not.toContain(apiKey);
+    });
+  });
+
+  describe('renderSite', () => {
+    it('should write identity, gzip and brotli files with same payload', async () => {
+      mockQuery.mockResolvedValueOnce({ rows: [{ id: 1 }] });
+      wordpressService.getEndpointUpdate.mockResolvedValue({
+        available: true,
+        new_endpoint: 'https://new.example.com/api'
+      });
+
+      const result = await staticContentService.renderSite(apiKey);
+
+      expect(result).toBe(true);
+
+      const basePath = path.join(contentDir, staticContentService.getFileName(apiKey));
+      const identity = fs.readFileSync(basePath);
+      const gunzipped = zlib.gunzipSync(fs.readFileSync(`${basePath}.gz`));
+      const unbrotli = zlib.brotliDecompressSync(fs.readFileSync(`${basePath}.br`));
+
+      expect(JSON.parse(identity)).toEqual({
+        ...mockContent,
+        endpoint_update: { available: true, new_endpoint: 'https://new.example.com/api' }
+      });
+      expect(gunzipped.equals(identity)).toBe(true);
+      expect(unbrotli.equals(identity)).toBe(true);
+    });
+
+    it('should remove files when site no longer exists', async () => {
+      mockQuery.mockResolvedValueOnce({ rows: [{ id: 1 }] });
+      await staticContentService.renderSite(apiKey);
+
+      mockQuery.mockResolvedValueOnce({ rows: [] });
+      const result = await staticContentService.renderSite(apiKey);
+
+      expect(result).toBe(false);
+      expect(fs.readdirSync(contentDir)).toEqual([]);
+      expect(wordpressService.loadContentByApiKey).toHaveBeenCalledTimes(1);
+    });
+
+    it('should not render the same site concurrently', async () => {
+      mockQuery.mockResolvedValue({ rows: [{ id: 1 }] });
+
+      const results = await Promise.all([
+        staticContentService.renderSite(apiKey),
+        staticContentService.renderSite(apiKey),
+        staticContentService.renderSite(apiKey)
+      ]);
+
+      // One running render + one coalesced follow-up render
+      expect(results).toEqual([true, true, true]);
+      expect(wordpressService.loadContentByApiKey).toHaveBeenCalledTimes(2);
+      expect(fs.readdirSync(contentDir).filter(file => file.endsWith('.tmp'))).toEqual([]);
+    });
+  });
+
+  describe('isCurrent', () => {
+    it('should report missing files and files from before process start as not current', async () => {
+      const fileName = staticContentService.getFileName(apiKey);
+      expect(await staticContentService.isCurrent(fileName)).toBe(false);
+
+      mockQuery.mockResolvedValueOnce({ rows: [{ id: 1 }] });
+      await staticContentService.renderSite(apiKey);
+      expect(await staticContentService.isCurrent(fileName)).toBe(true);
+
+      // Rendered by a previous process - render signals since then were not received
+      const past = new Date(Date.now() - 60 * 1000);
+      fs.utimesSync(path.join(contentDir, fileName), past, past);
+      expect(await staticContentService.isCurrent(fileName)).toBe(false);
+    });
+  });
+
+  describe('renderAllSites', () => {
+    it('should render all sites and remove orphaned files', async () => {
+      const orphanPath = path.join(contentDir, staticContentService.getFileName('api_deleted'));
+      fs.writeFileSync(orphanPath, '{}');
+      fs.writeFileSync(`${orphanPath}.gz`, '');
+      fs.writeFileSync(path.join(contentDir, 'unrelated.txt'), 'keep');
+
+      mockQuery
+        .mockResolvedValueOnce({ rows: [{ api_key: apiKey }] }) // SELECT api_key FROM sites
+        .mockResolvedValueOnce({ rows: [{ id: 1 }] }); // renderSite site lookup
+
+      const stats = await staticContentService.renderAllSites();
+
+      expect(stats).toEqual({ rendered: 1, removed: 0, failed: 0, orphans: 1 });
+      expect(fs.readdirSync(contentDir).sort()).toEqual(
+        [
+          staticContentService.getFileName(apiKey),
+          `${staticContentService.getFileName(apiKey)}.br`,
+          `${staticContentService.getFileName(apiKey)}.gz`,
+          'unrelated.txt'
+        ].sort()
+      );
+    });
+
+    it('should count failed renders without aborting', async () => {
+      mockQuery
+        .mockResolvedValueOnce({ rows: [{ api_key: apiKey }, { api_key: 'api_other' }] })
+        .mockResolvedValueOnce({ rows: [{ id: 1 }] })
+        .mockRejectedValueOnce(new Error('Database error'));
+
+      const stats = await staticContentService.renderAllSites();
+
+      expect(stats.rendered).toBe(1);
+      expect(stats.failed).toBe(1);
+    });
+  });
+
+  describe('scheduleRender', () => {
+    it('should do nothing when disabled', () => {
+      jest.useFakeTimers();
+      process.env.STATIC_CONTENT_ENABLED = 'false';
+
+      staticContentService.scheduleRender(apiKey);
+      jest.runAllTimers();
+
+      expect(mockQuery).not.toHaveBeenCalled();
+      expect(cache.publish).not.toHaveBeenCalled();
+      jest.useRealTimers();
+    });
+
+    it('should announce the render to other instances', () => {
+      jest.useFakeTimers();
+      mockQuery.mockResolvedValue({ rows: [] });
+
+      staticContentService.scheduleRender(apiKey);
+      jest.runAllTimers();
+      jest.useRealTimers();
+
+      expect(cache.publish).toHaveBeenCalledWith('static-content:render', expect.any(String));
+      expect(JSON.parse(cache.publish.mock.calls[0][1]).apiKey).toBe(apiKey);
+    });
+  });
+
+  describe('initRenderSync', () => {
+    let onMessage;
+    let onReady;
+
+    beforeEach(() => {
+      staticContentService.initRenderSync();
+      [, onMessage, onReady] = cache.subscribe.mock.calls[0];
+    });
+
+    it('should render sites announced by other instances only', () => {
+      jest.useFakeTimers();
+      mockQuery.mockResolvedValue({ rows: [] });
+
+      onMessage(JSON.stringify({ instanceId: 'other-instance', apiKey: 'api_other' }));
+      staticContentService.scheduleRender('api_own');
+      // Own signal comes back through Redis - must not be re-announced or queued again
+      onMessage(cache.publish.mock.calls[0][1]);
+      jest.runAllTimers();
+      jest.useRealTimers();
+
+      expect(cache.publish).toHaveBeenCalledTimes(1);
+      expect(mockQuery.mock.calls.map(call => call[1][0]).sort()).toEqual(['api_other', 'api_own']);
+    });
+
+    it('should treat files from before a reconnect as not current', async () => {
+      mockQuery.mockResolvedValueOnce({ rows: [{ id: 1 }] });
+      await staticContentService.renderSite(apiKey);
+
+      const fileName = staticContentService.getFileName(apiKey);
+      const past = new Date(Date.now() - 1000);
+      fs.utimesSync(path.join(contentDir, fileName), past, past);
+
+      // Signals published while disconnected were lost
+      onReady();
+
+      expect(await staticContentService.isCurrent(fileName)).toBe(false);
+    });
+  });
+});
@@ -10,6 +10,9 @@ require('dotenv').config();
 // Set test environment
 process.env.NODE_ENV = 'test';
 
+// Disable pre-rendered static content files (no background renders or disk writes)
+process.env.STATIC_CONTENT_ENABLED = 'false';
+
 // Mock logger to prevent console spam during tests
 jest.mock('../backend/config/logger', () => ({
   info: jest.fn(),
@@ -0,0 +1,189 @@
+/**
+ * Traffic Capture Tests
+ *
+ * Tests anonymized capture records used by testsprite_tests/traffic_replay.py:
+ * - getShape (flattened JSON path -> type map)
+ * - anonymizeQuery (sensitive values dropped)
+ * - anonymizePath (email tokens, static content hashes, numeric ids)
+ *   (parity with traffic_replay.py: testsprite_tests/test_traffic_replay.py)
+ * - buildRecord (no credentials, hashed api key ref)
+ * - attachShapeRecorder (res.json wrapper)
+ */
+
+const crypto = require('crypto');
+const {
+  getShape,
+  anonymizeQuery,
+  anonymizePath,
+  buildRecord,
+  attachShapeRecorder
+} = require('../../backend/utils/trafficCapture');
+
+describe('Traffic Capture', () => {
+  describe('getShape', () => {
+    it('should flatten objects and describe arrays by first element', () => {
+      const shape = getShape({
+        links: [{ url: 'https://example.com', id: 1, active: true }],
+        articles: [],
+        endpoint_update: null
+      });
+
+      expect(shape).toEqual({
+        $: 'object',
+        '$.articles': 'array',
+        '$.endpoint_update': 'null',
+        '$.links': 'array',
+        '$.links[]': 'object',
+        '$.links[].active': 'boolean',
+        '$.links[].id': 'number',
+        '$.links[].url': 'string'
+      });
+    });
+
+    it('should never include values', () => {
+      const shape = getShape({ email: 'user@example.com', token: 'secret-token' });
+
+      expect(JSON.stringify(shape)).not.toContain('user@example.com');
+      expect(JSON.stringify(shape)).not.toContain('secret-token');
+    });
+  });
+
+  describe('anonymizeQuery', () => {
+    it('should drop values of sensitive keys and keep others', () => {
+      expect(anonymizeQuery({ api_key: 'api_123', token: 'abc', page: '2' })).toEqual({
+        api_key: '',
+        token: '',
+        page: '2'
+      });
+    });
+  });
+
+  describe('anonymizePath', () => {
+    it('should keep regular paths and numeric ids', () => {
+      expect(anonymizePath('/api/projects/42/links')).toEqual({
+        path: '/api/projects/42/links',
+        hashRef: null
+      });
+    });
+
+    it('should redact email verification tokens of any length', () => {
+      const token = crypto.randomBytes(32).toString('hex');
+
+      expect(anonymizePath(`/api/auth/verify-email/${token}`).path).toBe(
+        '/api/auth/verify-email/:token'
+      );
+      expect(anonymizePath('/api/auth/verify-email/abc').path).toBe(
+        '/api/auth/verify-email/:token'
+      );
+    });
+
+    it('should not cascade redaction into following segments', () => {
+      expect(anonymizePath('/api/auth/verify-email/abc/def').path).toBe(
+        '/api/auth/verify-email/:token/def'
+      );
+      expect(anonymizePath('/api/sites/aB3dEfGhIjKlMnOpQrStUvWxYz12/placements/5').path).toBe(
+        '/api/sites/:token/placements/5'
+      );
+    });
+
+    it('should keep numeric ids after a credential parent segment', () => {
+      expect(anonymizePath('/api/sites/tokens/5').path).toBe('/api/sites/tokens/5');
+    });
+  });
+
+  describe('buildRecord', () => {
+    const res = { statusCode: 200, getHeader: () => '512' };
+
+    it('should replace API key with hashed reference', () => {
+      const req = {
+        method: 'GET',
+        originalUrl: '/api/wordpress/get-content?api_key=api_123',
+        headers: {},
+        query: { api_key: 'api_123' }
+      };
+
+      const record = buildRecord(req, res, 15, null);
+
+      expect(record).toMatchObject({
+        method: 'GET',
+        path: '/api/wordpress/get-content',
+        query: { api_key: '' },
+        auth: 'api_key',
+        status: 200,
+        duration_ms: 15,
+        bytes: 512
+      });
+      expect(record.api_key_ref).toMatch(/^[a-f0-9]{12}$/);
+      expect(JSON.stringify(record)).not.toContain('api_123');
+    });
+
+    it('should record bearer auth kind without the token', () => {
+      const req = {
+        method: 'GET',
+        originalUrl: '/api/projects/42',
+        headers: { authorization: 'Bearer eyJhbGciOi.secret' },
+        query: {}
+      };
+
+      const record = buildRecord(req, res, 5, null);
+
+      expect(record.auth).toBe('bearer');
+      expect(record.api_key_ref).toBeNull();
+      expect(JSON.stringify(record)).not.toContain('eyJhbGciOi');
+    });
+
+    it('should not record email verification tokens', () => {
+      const token = crypto.randomBytes(32).toString('hex');
+      const req = {
+        method: 'GET',
+        originalUrl: `/api/auth/verify-email/${token}`,
+        headers: {},
+        query: {}
+      };
+
+      const record = buildRecord(req, res, 5, null);
+
+      expect(record.path).toBe('/api/auth/verify-email/:token');
+      expect(JSON.stringify(record)).not.toContain(token);
+    });
+
+    it('should replace static content hash with api key ref', () => {
+      const apiKey = 'api_123';
+      const hash = crypto.createHash('sha256').update(apiKey).digest('hex');
+      const apiRequest = {
+        method: 'GET',
+        originalUrl: '/api/wordpress/get-content',
+        headers: { 'x-api-key': apiKey },
+        query: {}
+      };
+      const staticRequest = {
+        method: 'GET',
+        originalUrl: `/api/static-content/${hash}.json`,
+        headers: {},
+        query: {}
+      };
+
+      const keyRecord = buildRecord(apiRequest, res, 5, null);
+      const record = buildRecord(staticRequest, res, 5, null);
+
+      expect(record.path).toBe('/api/static-content/:hash.json');
+      expect(record.auth).toBe('static_hash');
+      // Same ref as the API poll of the same site - replay maps both to one staging key
+      expect(record.api_key_ref).toBe(keyRecord.api_key_ref);
+      expect(JSON.stringify(record)).not.toContain(hash);
+    });
+  });
+
+  describe('attachShapeRecorder', () => {
+    it('should store response shape and still send body', () => {
+      const originalJson = jest.fn().mockReturnThis();
+      const res = { json: originalJson, locals: {} };
+
+      attachShapeRecorder(res);
+      res.json({ success: true });
+
+      expect(res.locals.captureShape).toEqual({ $: 'object', '$.success': 'boolean' });
+      expect(originalJson).toHaveBeenCalledWith({ success: true });
+    });
+  });
+});
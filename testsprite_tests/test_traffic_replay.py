@@ -0,0 +1,237 @@
+"""
+Unit tests for traffic_replay.py helpers (no server, no aiohttp needed).
+
+The anonymize_path / response_shape fixtures are also fed to anonymizePath() / getShape()
+in backend/utils/trafficCapture.js (via node, skipped if node is not installed) - both
+sides must produce identical results, or compiled access logs and captures won't match.
+
+Run: python -m pytest testsprite_tests/test_traffic_replay.py -q
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import traffic_replay
+
+TRAFFIC_CAPTURE_JS = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "backend", "utils", "trafficCapture.js"
+)
+
+STATIC_HASH = hashlib.sha256(b"api_live_key").hexdigest()
+
+# (raw path, anonymized path, api_key_ref of static file)
+PATH_FIXTURES = [
+    ("/api/projects/42/links", "/api/projects/42/links", None),
+    ("/api/auth/verify-email/abc", "/api/auth/verify-email/:token", None),
+    # Redacted segment must not act as a parent of the next one
+    ("/api/auth/verify-email/abc/def", "/api/auth/verify-email/:token/def", None),
+    (
+        "/api/sites/aB3dEfGhIjKlMnOpQrStUvWxYz12/placements/5",
+        "/api/sites/:token/placements/5",
+        None,
+    ),
+    # Numeric ids stay after a credential parent (DELETE /api/sites/tokens/:id)
+    ("/api/sites/tokens/5", "/api/sites/tokens/5", None),
+    ("/api/auth/reset-password/x9", "/api/auth/reset-password/:token", None),
+    ("/api/orders/123e4567-e89b-12d3-a456-426614174000", "/api/orders/:uuid", None),
+    (f"/api/static-content/{STATIC_HASH}.json", "/api/static-content/:hash.json", STATIC_HASH[:12]),
+]
+
+SHAPE_FIXTURES = [
+    {"links": [{"url": "https://example.com", "id": 1, "active": True}], "articles": [],
+     "endpoint_update": None},
+    {"success": True, "data": {"total": 2.5, "items": [[1, 2]], "meta": {}}},
+    [],
+    "plain",
+    {"a": {"b": {"c": {"d": {"e": {"f": {"g": {"h": 1}}}}}}}},
+]
+
+
+def run_js(script, payload):
+    """Run snippet against trafficCapture.js with payload on stdin, return parsed JSON output"""
+    result = subprocess.run(
+        ["node", "-e", f"const t = require({json.dumps(TRAFFIC_CAPTURE_JS)});\n{script}"],
+        input=json.dumps(payload), capture_output=True, text=True, check=True, timeout=30,
+    )
+    return json.loads(result.stdout)
+
+
+requires_node = pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+
+
+# ------------------------------------------------------------------
+# anonymize_path
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("raw, expected, hash_ref", PATH_FIXTURES)
+def test_anonymize_path(raw, expected, hash_ref):
+    assert traffic_replay.anonymize_path(raw) == (expected, hash_ref)
+
+
+@requires_node
+def test_anonymize_path_matches_js():
+    paths = [raw for raw, _, _ in PATH_FIXTURES]
+    js_results = run_js(
+        "const paths = JSON.parse(require('fs').readFileSync(0, 'utf8'));\n"
+        "console.log(JSON.stringify(paths.map(p => t.anonymizePath(p))));",
+        paths,
+    )
+    assert [(r["path"], r["hashRef"]) for r in js_results] == [
+        traffic_replay.anonymize_path(raw) for raw in paths
+    ]
+
+
+# ------------------------------------------------------------------
+# response_shape / diff_shapes
+# ------------------------------------------------------------------
+
+def test_response_shape():
+    assert traffic_replay.response_shape(SHAPE_FIXTURES[0]) == {
+        "$": "object",
+        "$.articles": "array",
+        "$.endpoint_update": "null",
+        "$.links": "array",
+        "$.links[]": "object",
+        "$.links[].active": "boolean",
+        "$.links[].id": "number",
+        "$.links[].url": "string",
+    }
+
+
+@requires_node
+def test_response_shape_matches_js():
+    js_shapes = run_js(
+        "const values = JSON.parse(require('fs').readFileSync(0, 'utf8'));\n"
+        "console.log(JSON.stringify(values.map(v => t.getShape(v))));",
+        SHAPE_FIXTURES,
+    )
+    assert js_shapes == [traffic_replay.response_shape(value) for value in SHAPE_FIXTURES]
+
+
+def test_diff_shapes_ignores_children_of_empty_and_null():
+    expected = traffic_replay.response_shape({"links": [{"url": "x"}], "update": {"a": 1}})
+    actual = traffic_replay.response_shape({"links": [], "update": None})
+
+    assert traffic_replay.diff_shapes(expected, actual) == {"missing": [], "extra": [], "changed": []}
+
+
+def test_diff_shapes_reports_missing_extra_and_changed():
+    expected = traffic_replay.response_shape({"id": 1, "name": "a"})
+    actual = traffic_replay.response_shape({"id": "1", "title": "a"})
+
+    assert traffic_replay.diff_shapes(expected, actual) == {
+        "missing": ["$.name"],
+        "extra": ["$.title"],
+        "changed": ["$.id: number -> string"],
+    }
+
+
+# ------------------------------------------------------------------
+# percentile
+# ------------------------------------------------------------------
+
+def test_percentile():
+    values = [float(v) for v in range(1, 101)]
+
+    assert traffic_replay.percentile([], 50) is None
+    assert traffic_replay.percentile([7.25], 99) == 7.2
+    assert traffic_replay.percentile(values, 50) == 51.0
+    assert traffic_replay.percentile(values, 99) == 99.0
+
+
+# ------------------------------------------------------------------
+# parse_* / build_request
+# ------------------------------------------------------------------
+
+def test_parse_capture_line_keeps_anonymized_path():
+    line = json.dumps({
+        "ts": "2026-10-17T18:00:00.000Z", "method": "GET",
+        "path": "/api/sites/:token/placements/5", "query": {}, "auth": "bearer",
+        "api_key_ref": None, "status": 200, "shape": None,
+    })
+
+    assert traffic_replay.parse_capture_line(line)["path"] == "/api/sites/:token/placements/5"
+
+
+def test_parse_access_log_line_decodes_query_values():
+    line = ('1.2.3.4 - - [17/Oct/2026:18:00:00 +0000] '
+            '"GET /api/wordpress/get-content?search=a%20b&api_key=api%5Flive HTTP/1.1" 200 512')
+
+    record = traffic_replay.parse_access_log_line(line)
+
+    # Decoded once here - aiohttp encodes params when replaying (no "a%2520b")
+    assert record["query"] == {"search": "a b", "api_key": ""}
+    assert record["api_key_ref"] == traffic_replay.credential_ref("api_live")
+    assert record["auth"] == "api_key"
+
+
+def make_entry(**overrides):
+    entry = {
+        "method": "GET", "path": "/api/projects/42", "query": {}, "endpoint": "GET /api/projects/:id",
+        "auth": None, "api_key_ref": None,
+    }
+    entry.update(overrides)
+    return entry
+
+
+CREDENTIALS = {
+    "bearer": "user-jwt",
+    "admin_bearer": "admin-jwt",
+    "api_keys": {"abc123def456": "api_staging", "*": "api_fallback"},
+    "bodies": {"POST /api/billing/purchase": {"projectId": 1}},
+}
+
+
+def test_build_request_bearer_and_admin_bearer():
+    _, headers, _, _ = traffic_replay.build_request(make_entry(auth="bearer"), CREDENTIALS)
+    _, admin_headers, _, _ = traffic_replay.build_request(
+        make_entry(auth="bearer", path="/api/admin/users"), CREDENTIALS
+    )
+
+    assert headers == {"Authorization": "Bearer user-jwt"}
+    assert admin_headers == {"Authorization": "Bearer admin-jwt"}
+
+
+def test_build_request_api_key_moves_to_header():
+    entry = make_entry(auth="api_key", api_key_ref="abc123def456",
+                       query={"api_key": "", "search": "a b"})
+
+    path, headers, query, _ = traffic_replay.build_request(entry, CREDENTIALS)
+
+    assert path == "/api/projects/42"
+    assert headers == {"X-API-Key": "api_staging"}
+    assert query == {"search": "a b"}
+
+
+def test_build_request_rebuilds_static_content_hash():
+    entry = make_entry(auth="static_hash", api_key_ref="unmapped_ref",
+                       path="/api/static-content/:hash.json")
+
+    path, headers, _, _ = traffic_replay.build_request(entry, CREDENTIALS)
+
+    assert path == f"/api/static-content/{hashlib.sha256(b'api_fallback').hexdigest()}.json"
+    assert headers == {}
+
+
+def test_build_request_body_template():
+    entry = make_entry(method="POST", path="/api/billing/purchase", auth="bearer",
+                       endpoint="POST /api/billing/purchase")
+
+    assert traffic_replay.build_request(entry, CREDENTIALS)[3] == {"projectId": 1}
+
+
+@pytest.mark.parametrize("entry, credentials, reason", [
+    (make_entry(path="/api/auth/verify-email/:token"), CREDENTIALS, "credential in path"),
+    (make_entry(auth="bearer"), {}, "no bearer token"),
+    (make_entry(auth="api_key", api_key_ref="abc123def456"), {"api_keys": {}}, "no api key"),
+    (make_entry(auth="static_hash", path="/api/static-content/:hash.json"), {}, "no api key"),
+    (make_entry(method="PUT", auth="bearer", endpoint="PUT /api/projects/:id"), CREDENTIALS,
+     "no body template"),
+])
+def test_build_request_skip_reasons(entry, credentials, reason):
+    assert traffic_replay.build_request(entry, credentials) == reason
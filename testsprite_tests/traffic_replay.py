@@ -0,0 +1,557 @@
+"""
+Traffic capture replay - reproduce a realistic production load mix on staging.
+
+Complements the TC0xx flow tests: those check single endpoint flows, this replays
+the captured mix (plugin polls + purchases + dashboards) with original timing.
+
+Sources (auto-detected per line):
+  - capture JSONL written by trackRequest when TRAFFIC_CAPTURE_FILE is set
+    (backend/utils/trafficCapture.js - anonymized, includes response shapes)
+  - nginx / Apache combined access logs (no shapes, status only)
+
+Usage:
+  # 1. Compile a scenario (optionally a time window of the log)
+  python traffic_replay.py compile capture.jsonl -o peak.json --start 2026-10-17T18:00 --minutes 60
+
+  # 2. Replay against staging at original speed or N x faster
+  python traffic_replay.py replay peak.json --target http://staging:3003 \\
+      --credentials creds.json --speed 4 --concurrency 200 --report report.json
+
+Credentials file (captures never contain secrets - map them to staging accounts).
+api_keys covers both API polls and /api/static-content/<sha256(api_key)>.json polls
+(the file name is rebuilt from the mapped staging key):
+  {
+    "bearer": "<staging JWT>",
+    "admin_bearer": "<staging admin JWT>",       # optional, used for /api/admin/*
+    "api_keys": {"<api_key_ref>": "<staging api key>", "*": "<fallback api key>"},
+    "bodies": {"POST /api/billing/purchase": {"projectId": 1, "siteId": 2, "type": "link",
+                                              "contentIds": [3]}}
+  }
+
+Requests needing a credential or body that is not mapped (or a one-time token in the path,
+e.g. /api/auth/verify-email/:token) are skipped and counted.
+Replay needs aiohttp (pip install aiohttp); compile has no dependencies.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import re
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import unquote_plus
+
+SCENARIO_VERSION = 1
+TIMEOUT = 30
+
+# Same limits as backend/utils/trafficCapture.js
+SHAPE_MAX_DEPTH = 6
+SHAPE_MAX_KEYS = 50
+
+# Combined log format: ip - user [time] "METHOD /path HTTP/1.1" status bytes ...
+ACCESS_LOG_PATTERN = re.compile(
+    r'^\S+ \S+ \S+ \[(?P<time>[^\]]+)\] "(?P<method>[A-Z]+) (?P<url>\S+) [^"]*" '
+    r'(?P<status>\d{3}) (?P<bytes>\d+|-)'
+)
+
+# Path segments that are credentials themselves - same rules as anonymizePath() in
+# trafficCapture.js (access logs are redacted here, captures already are)
+CREDENTIAL_SEGMENT_PATTERNS = [
+    (re.compile(r"^[a-f0-9]{64}\.json$"), ":hash.json"),
+    (re.compile(r"^[0-9a-f]{8}-[0-9a-f-]{27}$", re.I), ":uuid"),
+    (re.compile(r"^(?=.*\d)[A-Za-z0-9_-]{24,}$"), ":token"),
+]
+CREDENTIAL_PARENT_PATTERN = re.compile(r"verify|reset|token|secret", re.I)
+# Numeric ids stay even after a credential parent (e.g. DELETE /api/sites/tokens/:id)
+NUMERIC_SEGMENT_PATTERN = re.compile(r"[0-9]+")
+
+# Placeholders that cannot be replayed (one-time tokens are not mapped to staging)
+UNREPLAYABLE_PLACEHOLDERS = (":token", ":uuid")
+
+SENSITIVE_QUERY_PATTERN = re.compile(r"token|password|secret|key|email|code|signature", re.I)
+
+
+# ------------------------------------------------------------------
+# Shared helpers
+# ------------------------------------------------------------------
+
+def credential_ref(value):
+    """Short sha256 ref of a credential; must match credentialRef() in trafficCapture.js"""
+    return hashlib.sha256(str(value).encode()).hexdigest()[:12]
+
+
+def anonymize_path(path):
+    """Replace credential segments with placeholders -> (path, api_key_ref of static file)"""
+    hash_ref = None
+    original = path.split("/")
+    segments = list(original)
+    for index, segment in enumerate(original):
+        # Parent rule checks the original segment - a redacted ":token" must not cascade
+        if (index > 1 and segment and not NUMERIC_SEGMENT_PATTERN.fullmatch(segment)
+                and CREDENTIAL_PARENT_PATTERN.search(original[index - 1])):
+            segments[index] = ":token"
+            continue
+        for pattern, placeholder in CREDENTIAL_SEGMENT_PATTERNS:
+            if pattern.match(segment):
+                # Static file name is sha256(api_key) - its prefix equals credential_ref(api_key)
+                if placeholder == ":hash.json":
+                    hash_ref = segment[:12]
+                segments[index] = placeholder
+                break
+    return "/".join(segments), hash_ref
+
+
+def normalize_endpoint(method, path):
+    """Group concrete paths per route: GET /api/projects/12 -> GET /api/projects/:id"""
+    segments = [":id" if segment.isdigit() else segment for segment in path.split("/")]
+    return f"{method} {'/'.join(segments)}"
+
+
+def type_of(value):
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    return "object"
+
+
+def response_shape(value, path="$", depth=0, shape=None):
+    """Flatten JSON into {path: type}; must match getShape() in trafficCapture.js"""
+    if shape is None:
+        shape = {}
+    kind = type_of(value)
+    shape[path] = kind
+
+    if depth >= SHAPE_MAX_DEPTH:
+        return shape
+
+    if kind == "array" and value:
+        response_shape(value[0], f"{path}[]", depth + 1, shape)
+    elif kind == "object":
+        for key in sorted(value.keys())[:SHAPE_MAX_KEYS]:
+            response_shape(value[key], f"{path}.{key}", depth + 1, shape)
+
+    return shape
+
+
+def diff_shapes(expected, actual):
+    """Compare shapes; children are ignored where the other side had null or an empty array"""
+    def covered(path, other):
+        # "$.links[].url" is not comparable if the other side saw "$.links" as [] (or null)
+        for match in re.finditer(r"\.|\[\]", path):
+            parent = path[: match.start()]
+            if other.get(parent) == "null":
+                return True
+            if other.get(parent) == "array" and f"{parent}[]" not in other:
+                return True
+        return False
+
+    diff = {"missing": [], "extra": [], "changed": []}
+    for path, kind in expected.items():
+        if path not in actual:
+            if not covered(path, actual):
+                diff["missing"].append(path)
+        elif actual[path] != kind and "null" not in (kind, actual[path]):
+            diff["changed"].append(f"{path}: {kind} -> {actual[path]}")
+    for path in actual:
+        if path not in expected and not covered(path, expected):
+            diff["extra"].append(path)
+    return diff
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return round(sorted_values[index], 1)
+
+
+# ------------------------------------------------------------------
+# Compile
+# ------------------------------------------------------------------
+
+def parse_capture_line(line):
+    record = json.loads(line)
+    return {
+        "ts": datetime.fromisoformat(record["ts"].replace("Z", "+00:00")),
+        "method": record["method"],
+        # Already anonymized by trafficCapture.js - placeholders must not be redacted again
+        "path": record["path"],
+        "query": record.get("query") or {},
+        "auth": record.get("auth"),
+        "api_key_ref": record.get("api_key_ref"),
+        "status": record.get("status"),
+        "shape": record.get("shape"),
+    }
+
+
+def parse_access_log_line(line):
+    match = ACCESS_LOG_PATTERN.match(line)
+    if not match:
+        return None
+
+    raw_path, _, query_string = match.group("url").partition("?")
+    # Access logs are not anonymized - never carry credentials into the scenario
+    path, hash_ref = anonymize_path(raw_path)
+    query = {}
+    api_key_ref = None
+    for pair in filter(None, query_string.split("&")):
+        # Decoded like req.query in Express - aiohttp encodes params again when replaying
+        key, _, value = (unquote_plus(part) for part in pair.partition("="))
+        if key == "api_key" and value:
+            api_key_ref = credential_ref(value)
+        query[key] = "" if SENSITIVE_QUERY_PATTERN.search(key) else value[:100]
+
+    # Access logs don't show headers - only query api_key and static file hashes are detectable
+    auth = None
+    if api_key_ref:
+        auth = "api_key"
+    elif hash_ref:
+        auth = "static_hash"
+
+    return {
+        "ts": datetime.strptime(match.group("time"), "%d/%b/%Y:%H:%M:%S %z"),
+        "method": match.group("method"),
+        "path": path,
+        "query": query,
+        "auth": auth,
+        "api_key_ref": api_key_ref or hash_ref,
+        "status": int(match.group("status")),
+        "shape": None,
+    }
+
+
+def read_log(paths):
+    records, skipped = [], 0
+    for log_path in paths:
+        with open(log_path, encoding="utf-8", errors="replace") as log_file:
+            for line in log_file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = parse_capture_line(line) if line.startswith("{") else parse_access_log_line(line)
+                except (ValueError, KeyError):
+                    record = None
+                if record is None:
+                    skipped += 1
+                else:
+                    records.append(record)
+    return records, skipped
+
+
+def compile_scenario(args):
+    records, skipped = read_log(args.logs)
+    records.sort(key=lambda r: r["ts"])
+
+    if args.start:
+        start = datetime.fromisoformat(args.start)
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        records = [r for r in records if r["ts"] >= start]
+    if args.minutes and records:
+        end = records[0]["ts"] + timedelta(minutes=args.minutes)
+        records = [r for r in records if r["ts"] < end]
+    if args.exclude:
+        exclude = re.compile(args.exclude)
+        records = [r for r in records if not exclude.search(r["path"])]
+
+    if not records:
+        sys.exit("No requests left to compile")
+
+    origin = records[0]["ts"]
+    requests_list = [
+        {
+            "offset": round((r["ts"] - origin).total_seconds(), 3),
+            "method": r["method"],
+            "path": r["path"],
+            "query": r["query"],
+            "endpoint": normalize_endpoint(r["method"], r["path"]),
+            "auth": r["auth"],
+            "api_key_ref": r["api_key_ref"],
+            "expected_status": r["status"],
+            "expected_shape": r["shape"],
+        }
+        for r in records
+    ]
+
+    scenario = {
+        "version": SCENARIO_VERSION,
+        "source": args.logs,
+        "captured_from": origin.isoformat(),
+        "duration_seconds": requests_list[-1]["offset"],
+        "requests": requests_list,
+    }
+
+    with open(args.output, "w", encoding="utf-8") as out:
+        json.dump(scenario, out)
+
+    mix = {}
+    for entry in requests_list:
+        mix[entry["endpoint"]] = mix.get(entry["endpoint"], 0) + 1
+    print(f"Compiled {len(requests_list)} requests over {scenario['duration_seconds']}s "
+          f"({skipped} unparsed lines) -> {args.output}")
+    for endpoint, count in sorted(mix.items(), key=lambda item: -item[1])[:15]:
+        print(f"  {count:>7}  {endpoint}")
+
+
+# ------------------------------------------------------------------
+# Replay
+# ------------------------------------------------------------------
+
+def build_request(entry, credentials):
+    """Return (path, headers, query, body) or a skip reason string"""
+    path = entry["path"]
+    headers = {}
+    query = dict(entry["query"])
+    body = None
+
+    if any(placeholder in path.split("/") for placeholder in UNREPLAYABLE_PLACEHOLDERS):
+        return "credential in path"
+
+    if entry["auth"] == "bearer":
+        is_admin = entry["path"].startswith("/api/admin")
+        token = credentials.get("admin_bearer") if is_admin else None
+        token = token or credentials.get("bearer")
+        if not token:
+            return "no bearer token"
+        headers["Authorization"] = f"Bearer {token}"
+    elif entry["auth"] == "api_key":
+        api_keys = credentials.get("api_keys", {})
+        api_key = api_keys.get(entry["api_key_ref"]) or api_keys.get("*")
+        if not api_key:
+            return "no api key"
+        headers["X-API-Key"] = api_key
+        query.pop("api_key", None)
+    elif entry["auth"] == "static_hash":
+        # Static content is addressed by sha256 of the key - rebuild it for the staging key
+        api_keys = credentials.get("api_keys", {})
+        api_key = api_keys.get(entry["api_key_ref"]) or api_keys.get("*")
+        if not api_key:
+            return "no api key"
+        file_name = hashlib.sha256(api_key.encode()).hexdigest() + ".json"
+        path = path.replace(":hash.json", file_name)
+
+    if entry["method"] in ("POST", "PUT", "PATCH"):
+        body = credentials.get("bodies", {}).get(entry["endpoint"])
+        if body is None:
+            return "no body template"
+
+    # Sensitive query values were blanked at capture time - drop them instead of sending ""
+    query = {key: value for key, value in query.items() if value != ""}
+    return path, headers, query, body
+
+
+class EndpointStats:
+    def __init__(self):
+        self.latencies = []
+        self.statuses = {}
+        self.errors = 0
+        self.status_mismatches = 0
+        self.shape_diffs = {}
+        self.skipped = {}
+
+    def record_shape_diff(self, diff):
+        for kind, paths in diff.items():
+            for path in paths:
+                key = f"{kind}: {path}"
+                self.shape_diffs[key] = self.shape_diffs.get(key, 0) + 1
+
+
+async def send(session, target, entry, credentials, stats, verify_shapes):
+    prepared = build_request(entry, credentials)
+    if isinstance(prepared, str):
+        stats.skipped[prepared] = stats.skipped.get(prepared, 0) + 1
+        return
+
+    path, headers, query, body = prepared
+    started = time.perf_counter()
+    try:
+        async with session.request(
+            entry["method"], target + path, params=query, json=body, headers=headers
+        ) as resp:
+            payload = await resp.read()
+            status, content_type = resp.status, resp.content_type
+    except Exception as error:  # aiohttp.ClientError, timeouts, connection resets
+        stats.latencies.append((time.perf_counter() - started) * 1000)
+        stats.errors += 1
+        stats.statuses[type(error).__name__] = stats.statuses.get(type(error).__name__, 0) + 1
+        return
+
+    stats.latencies.append((time.perf_counter() - started) * 1000)
+    stats.statuses[status] = stats.statuses.get(status, 0) + 1
+
+    if entry["expected_status"] and status != entry["expected_status"]:
+        stats.status_mismatches += 1
+    elif verify_shapes and entry["expected_shape"] and content_type == "application/json":
+        try:
+            actual = response_shape(json.loads(payload))
+        except ValueError:
+            actual = {"$": "invalid json"}
+        stats.record_shape_diff(diff_shapes(entry["expected_shape"], actual))
+
+
+async def run_replay(scenario, args, credentials):
+    try:
+        import aiohttp
+    except ImportError:
+        sys.exit("Replay requires aiohttp: pip install aiohttp")
+
+    target = args.target.rstrip("/")
+    entries = scenario["requests"]
+    if args.limit:
+        entries = entries[: args.limit]
+
+    stats = {}
+    # Pooled keep-alive connections, like plugins/browsers hitting the load balancer
+    connector = aiohttp.TCPConnector(limit=args.concurrency, limit_per_host=args.concurrency)
+    timeout = aiohttp.ClientTimeout(total=TIMEOUT)
+    semaphore = asyncio.Semaphore(args.concurrency * 4)  # bound queued tasks when target falls behind
+
+    async def fire(entry):
+        try:
+            await send(session, target, entry, credentials,
+                       stats.setdefault(entry["endpoint"], EndpointStats()), not args.no_shapes)
+        finally:
+            semaphore.release()
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        tasks = []
+        lag = 0.0
+
+        for entry in entries:
+            due = started + entry["offset"] / args.speed
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                lag = max(lag, -delay)
+            await semaphore.acquire()
+            tasks.append(asyncio.ensure_future(fire(entry)))
+
+        await asyncio.gather(*tasks)
+        elapsed = loop.time() - started
+
+    return build_report(scenario, args, stats, elapsed, lag)
+
+
+def build_report(scenario, args, stats, elapsed, lag):
+    endpoints = {}
+    for endpoint, s in sorted(stats.items(), key=lambda item: -len(item[1].latencies)):
+        latencies = sorted(s.latencies)
+        endpoints[endpoint] = {
+            "count": len(latencies),
+            "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else None,
+            "latency_ms": {
+                "p50": percentile(latencies, 50),
+                "p90": percentile(latencies, 90),
+                "p99": percentile(latencies, 99),
+                "max": round(latencies[-1], 1) if latencies else None,
+            },
+            "statuses": {str(key): value for key, value in s.statuses.items()},
+            "errors": s.errors,
+            "status_mismatches": s.status_mismatches,
+            "shape_diffs": dict(sorted(s.shape_diffs.items(), key=lambda item: -item[1])),
+            "skipped": s.skipped,
+        }
+
+    all_latencies = sorted(latency for s in stats.values() for latency in s.latencies)
+    return {
+        "target": args.target,
+        "speed": args.speed,
+        "captured_duration_seconds": scenario["duration_seconds"],
+        "elapsed_seconds": round(elapsed, 2),
+        "max_schedule_lag_seconds": round(lag, 3),
+        "total": {
+            "count": len(all_latencies),
+            "throughput_rps": round(len(all_latencies) / elapsed, 2) if elapsed else None,
+            "p50": percentile(all_latencies, 50),
+            "p90": percentile(all_latencies, 90),
+            "p99": percentile(all_latencies, 99),
+            "errors": sum(s.errors for s in stats.values()),
+            "skipped": sum(sum(s.skipped.values()) for s in stats.values()),
+        },
+        "endpoints": endpoints,
+    }
+
+
+def print_report(report):
+    total = report["total"]
+    print(f"\nReplayed {total['count']} requests in {report['elapsed_seconds']}s "
+          f"(speed {report['speed']}x, {total['throughput_rps']} req/s, "
+          f"max schedule lag {report['max_schedule_lag_seconds']}s)")
+    print(f"p50 {total['p50']}ms  p90 {total['p90']}ms  p99 {total['p99']}ms  "
+          f"errors {total['errors']}  skipped {total['skipped']}\n")
+
+    print(f"{'endpoint':<55} {'count':>7} {'rps':>8} {'p50':>8} {'p90':>8} {'p99':>8} "
+          f"{'err':>5} {'mism':>5} {'shape':>6}")
+    for endpoint, e in report["endpoints"].items():
+        latency = e["latency_ms"]
+        print(f"{endpoint[:55]:<55} {e['count']:>7} {e['throughput_rps'] or 0:>8} "
+              f"{latency['p50'] or '-':>8} {latency['p90'] or '-':>8} {latency['p99'] or '-':>8} "
+              f"{e['errors']:>5} {e['status_mismatches']:>5} {len(e['shape_diffs']):>6}")
+        for diff, count in list(e["shape_diffs"].items())[:5]:
+            print(f"    shape {diff} (x{count})")
+
+
+def replay_scenario(args):
+    with open(args.scenario, encoding="utf-8") as scenario_file:
+        scenario = json.load(scenario_file)
+    if scenario.get("version") != SCENARIO_VERSION:
+        sys.exit(f"Unsupported scenario version: {scenario.get('version')}")
+
+    credentials = {}
+    if args.credentials:
+        with open(args.credentials, encoding="utf-8") as credentials_file:
+            credentials = json.load(credentials_file)
+
+    report = asyncio.run(run_replay(scenario, args, credentials))
+    print_report(report)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as out:
+            json.dump(report, out, indent=2)
+        print(f"\nReport written to {args.report}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile and replay captured API traffic")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser("compile", help="Compile request logs into a scenario")
+    compile_parser.add_argument("logs", nargs="+", help="Capture JSONL or combined access logs")
+    compile_parser.add_argument("-o", "--output", default="scenario.json")
+    compile_parser.add_argument("--start", help="ISO time to start from (UTC if no offset)")
+    compile_parser.add_argument("--minutes", type=float, help="Window length from first request")
+    compile_parser.add_argument("--exclude", help="Regex of paths to drop (e.g. '^/api/auth/')")
+    compile_parser.set_defaults(handler=compile_scenario)
+
+    replay_parser = commands.add_parser("replay", help="Replay a scenario against a target")
+    replay_parser.add_argument("scenario")
+    replay_parser.add_argument("--target", default="http://localhost:3003")
+    replay_parser.add_argument("--credentials", help="JSON file with staging tokens/keys/bodies")
+    replay_parser.add_argument("--speed", type=float, default=1.0, help="Time compression factor (N x)")
+    replay_parser.add_argument("--concurrency", type=int, default=100, help="Connection pool size")
+    replay_parser.add_argument("--limit", type=int, help="Replay only the first N requests")
+    replay_parser.add_argument("--no-shapes", action="store_true", help="Skip response shape diffs")
+    replay_parser.add_argument("--report", help="Write JSON report to this file")
+    replay_parser.set_defaults(handler=replay_scenario)
+
+    args = parser.parse_args()
+    if getattr(args, "speed", 1.0) <= 0:
+        parser.error("--speed must be positive")
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
  * Plugin Name: Serparium Link Widget
  * Plugin URI: https://serparium.com
  * Description: Display placed links and articles from Serparium.com
- * Version: 2.7.8
+ * Version: 2.7.9
  * Author: NDA Team (SEO is Dead)
  * License: GPL v2 or later
  * Text Domain: link-manager-widget
@@ -16,7 +16,7 @@ if (!defined('ABSPATH')) {
 }
 
 // Define plugin constants
-define('LMW_VERSION', '2.7.8');
+define('LMW_VERSION', '2.7.9');
 define('LMW_PLUGIN_URL', plugin_dir_url(__FILE__));
 define('LMW_PLUGIN_PATH', plugin_dir_path(__FILE__));
 
@@ -762,9 +762,35 @@ class LinkManagerWidget {
         return false;
     }
 
+    /**
+     * Fetch pre-rendered static content (precompressed file, no server-side DB work)
+     * File name is sha256 of the API key; returns false if not rendered yet
+     */
+    private function fetch_static_content() {
+        $response = wp_remote_get(
+            $this->api_endpoint . '/static-content/' . hash('sha256', $this->api_key) . '.json',
+            array(
+                'timeout' => LMW_API_TIMEOUT,
+                'sslverify' => true,
+                'headers' => array(
+                    'Accept' => 'application/json'
+                )
+            )
+        );
+
+        if (is_wp_error($response) || wp_remote_retrieve_response_code($response) !== 200) {
+            return false;
+        }
+
+        $data = json_decode(wp_remote_retrieve_body($response), true);
+
+        return ($data && isset($data['links'])) ? $data : false;
+    }
+
     /**
      * Fetch content from API with multi-layer fallback
      * Layer 1: Transient cache (5 min)
+     * Source: pre-rendered static content, then API
      * Layer 2: wp_options persistent cache (7 days)
      * Layer 3: File cache (UNLIMITED)
      */
@@ -777,34 +803,37 @@ class LinkManagerWidget {
             return $cached;
         }
 
-        // Try to fetch from API
-        $response = wp_remote_get(
-            $this->api_endpoint . '/wordpress/get-content',
-            array(
-                'timeout' => LMW_API_TIMEOUT,
-                'sslverify' => true,
-                'headers' => array(
-                    'Accept' => 'application/json',
-                    'X-API-Key' => $this->api_key
+        // Try pre-rendered static content first, then the API
+        $data = $this->fetch_static_content();
+
+        if ($data === false) {
+            $response = wp_remote_get(
+                $this->api_endpoint . '/wordpress/get-content',
+                array(
+                    'timeout' => LMW_API_TIMEOUT,
+                    'sslverify' => true,
+                    'headers' => array(
+                        'Accept' => 'application/json',
+                        'X-API-Key' => $this->api_key
+                    )
                 )
-            )
-        );
+            );
 
-        if (!is_wp_error($response)) {
-            $body = wp_remote_retrieve_body($response);
-            $data = json_decode($body, true);
+            if (!is_wp_error($response)) {
+                $data = json_decode(wp_remote_retrieve_body($response), true);
+            }
+        }
 
-            if ($data && isset($data['links'])) {
-                // SUCCESS: Update ALL cache layers
-                set_transient($cache_key, $data, $this->cache_duration);
-                $this->update_persistent_storage($data);
-                $this->update_file_cache($data);
+        if ($data && isset($data['links'])) {
+            // SUCCESS: Update ALL cache layers
+            set_transient($cache_key, $data, $this->cache_duration);
+            $this->update_persistent_storage($data);
+            $this->update_file_cache($data);
 
-                // Check for endpoint update from server
-                $this->check_endpoint_update($data);
+            // Check for endpoint update from server
+            $this->check_endpoint_update($data);
 
-                return $data;
-            }
+            return $data;
         }
 
         // API FAILED - use fallback layers